@@ -1,7 +1,7 @@
 import os
 from abc import ABCMeta, abstractmethod
 
-from sqlalchemy import MetaData, create_engine
+from sqlalchemy import MetaData, create_engine, event, inspect
 from sqlalchemy.ext.automap import automap_base
 from sqlalchemy.orm import create_session
 
@@ -11,6 +11,22 @@ from cumulusci.tasks.bulkdata.mapping_parser import parse_from_yaml
 
 from .utils import create_table
 
+# The generated database is scratch output which can always be generated
+# again, so trade durability for insert speed.
+SQLITE_BULK_INSERT_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def _set_sqlite_bulk_insert_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_BULK_INSERT_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 
 class BaseGenerateDataTask(BaseTask, metaclass=ABCMeta):
     """Abstract base class for any class that generates data in a SQL DB."""
@@ -78,12 +94,15 @@ class BaseGenerateDataTask(BaseTask, metaclass=ABCMeta):
     @staticmethod
     def init_db(db_url, mappings):
         engine = create_engine(db_url)
+        if engine.dialect.name == "sqlite":
+            event.listen(engine, "connect", _set_sqlite_bulk_insert_pragmas)
         metadata = MetaData()
         metadata.bind = engine
         if mappings:
+            existing_tables = set(inspect(engine).get_table_names())
             for name, mapping in mappings.items():
                 if "table" in mapping and mapping["table"] not in metadata.tables:
-                    create_table(mapping, metadata)
+                    create_table(mapping, metadata, existing_tables)
         metadata.create_all()
         base = automap_base(bind=engine, metadata=metadata)
         base.prepare(engine, reflect=True)
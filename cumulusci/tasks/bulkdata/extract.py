@@ -18,9 +18,11 @@ from cumulusci.tasks.bulkdata.mapping_parser import (
     validate_and_inject_mapping,
 )
 from cumulusci.tasks.bulkdata.step import (
+    DataApi,
     DataOperationStatus,
     DataOperationType,
     get_query_operation,
+    get_record_counts,
 )
 from cumulusci.tasks.bulkdata.utils import (
     SqlAlchemyMixin,
@@ -80,9 +82,18 @@ class ExtractData(SqlAlchemyMixin, BaseSalesforceApiTask):
     def _run_task(self):
         self._init_mapping()
         with self._init_db():
+            # Look up the volumes of all smart-API sObjects up front
+            record_counts = get_record_counts(
+                self.sf,
+                (
+                    mapping.sf_object
+                    for mapping in self.mapping.values()
+                    if mapping.api in (DataApi.SMART, None)
+                ),
+            )
             for mapping in self.mapping.values():
                 soql = self._soql_for_mapping(mapping)
-                self._run_query(soql, mapping)
+                self._run_query(soql, mapping, record_counts)
 
             self._map_autopks()
 
@@ -146,7 +157,7 @@ class ExtractData(SqlAlchemyMixin, BaseSalesforceApiTask):
 
         return soql
 
-    def _run_query(self, soql, mapping):
+    def _run_query(self, soql, mapping, record_counts=None):
         """Execute a Bulk or REST API query job and store the results."""
 
         step = get_query_operation(
@@ -156,6 +167,7 @@ class ExtractData(SqlAlchemyMixin, BaseSalesforceApiTask):
             api_options={},
             context=self,
             query=soql,
+            record_counts=record_counts,
         )
 
         self.logger.info(f"Extracting data for sObject {mapping['sf_object']}")
@@ -187,7 +199,7 @@ class ExtractData(SqlAlchemyMixin, BaseSalesforceApiTask):
         # TODO: log_progress needs to know our batch size, when made configurable.
         record_iterator = log_progress(step.get_results(), self.logger)
         if record_type:
-            record_iterator = (record + [record_type] for record in record_iterator)
+            record_iterator = _append_value(record_iterator, record_type)
 
         # Convert relative dates to stable dates.
         if mapping.anchor_date:
@@ -439,3 +451,11 @@ class ExtractData(SqlAlchemyMixin, BaseSalesforceApiTask):
             soql = f"{soql} WHERE {filter_clause}"
 
         return soql
+
+
+def _append_value(records, value):
+    """Append the value to each record. Query results are fresh lists,
+    so they can be extended in place instead of copied."""
+    for record in records:
+        record.append(value)
+        yield record
@@ -78,6 +78,9 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
         "bulk_mode": {
             "description": "Set to Serial to force serial mode on all jobs. Parallel is the default."
         },
+        "rest_workers": {
+            "description": "The number of REST API requests to send at the same time for steps that use the REST API. Defaults to 1, and is ignored in Serial mode."
+        },
         "inject_namespaces": {
             "description": "If True, the package namespace prefix will be "
             "automatically added to (or removed from) objects "
@@ -111,6 +114,10 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
         )
         if self.bulk_mode and self.bulk_mode not in ["Serial", "Parallel"]:
             raise TaskOptionsError("bulk_mode must be either Serial or Parallel")
+        rest_workers = self.options.get("rest_workers")
+        self.rest_workers = int(rest_workers) if rest_workers else None
+        if self.rest_workers is not None and self.rest_workers < 1:
+            raise TaskOptionsError("rest_workers must be at least 1")
 
         inject_namespaces = self.options.get("inject_namespaces")
         self.options["inject_namespaces"] = process_bool_arg(
@@ -308,6 +315,8 @@ class LoadData(SqlAlchemyMixin, BaseSalesforceApiTask):
         """Create a step appropriate to the action"""
         bulk_mode = mapping.bulk_mode or self.bulk_mode or "Parallel"
         api_options = {"batch_size": mapping.batch_size, "bulk_mode": bulk_mode}
+        if self.rest_workers:
+            api_options["rest_workers"] = self.rest_workers
 
         fields = mapping.get_load_field_list()
 
@@ -154,12 +154,8 @@ class MappingStep(CCIDictModel):
             fields["Id"] = "sf_id"
 
         fields.update(self.fields)
-        fields.update(
-            {
-                lookup: self.lookups[lookup].get_lookup_key_field()
-                for lookup in self.lookups
-            }
-        )
+        for lookup, lookup_spec in self.lookups.items():
+            fields[lookup] = lookup_spec.get_lookup_key_field()
 
         return fields
 
@@ -1,27 +1,53 @@
 import csv
 import io
+import itertools
 import json
+import operator
 import os
 import pathlib
 import tempfile
 import time
+import urllib.parse
 from abc import ABCMeta, abstractmethod
-from contextlib import contextmanager
-from typing import Any, Dict, List, NamedTuple, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from functools import cached_property
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
 
 import requests
 import salesforce_bulk
+from lxml import etree as lxml_etree
+from requests.adapters import HTTPAdapter
+from simple_salesforce import format_soql
 
 from cumulusci.core.enums import StrEnum
 from cumulusci.core.exceptions import BulkDataException
 from cumulusci.core.utils import process_bool_arg
 from cumulusci.tasks.bulkdata.utils import iterate_in_chunks
 from cumulusci.utils.classutils import namedtuple_as_simple_dict
-from cumulusci.utils.xml import lxml_parse_string
 
 DEFAULT_BULK_BATCH_SIZE = 10_000
 DEFAULT_REST_BATCH_SIZE = 200
 MAX_REST_BATCH_SIZE = 200
+# REST DML chunks are sent one at a time unless the rest_workers API option
+# asks for more, staying well below the org's limit on concurrent API requests.
+DEFAULT_REST_WORKERS = 1
+MAX_REST_WORKERS = 5
+# Bulk job polling backs off exponentially between these bounds (in seconds),
+# and drops back to the floor whenever another batch completes.
+POLL_INTERVAL_FLOOR = float(os.environ.get("CUMULUSCI_BULK_POLL_FLOOR", 1))
+POLL_INTERVAL_CEILING = float(os.environ.get("CUMULUSCI_BULK_POLL_CEILING", 60))
+POLL_INTERVAL_FACTOR = float(os.environ.get("CUMULUSCI_BULK_POLL_FACTOR", 2.0))
+# Previous record values are fetched with concurrent REST queries of at most
+# this many update keys, as long as each query fits in a REST query string.
+PREV_VALUES_QUERY_CHUNK_SIZE = 400
+PREV_VALUES_QUERY_WORKERS = 8
+MAX_REST_QUERY_LENGTH = 16_000
+# Number of Bulk DML batch result files downloaded at the same time.
+DEFAULT_DOWNLOAD_WORKERS = 4
+# Bytes read from the response at a time when downloading result files.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 csv.field_size_limit(2**27)  # 128 MB
 
 
@@ -73,17 +99,29 @@ class DataOperationJobResult(NamedTuple):
         return namedtuple_as_simple_dict(self)
 
 
+def _new_bulk_session() -> requests.Session:
+    """Create a requests Session whose connection pool can be shared
+    across the polling and result-download calls of one Bulk API job."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 @contextmanager
-def download_file(uri, bulk_api, *, chunk_size=8192):
+def download_file(uri, bulk_api, *, chunk_size=DOWNLOAD_CHUNK_SIZE, session=None):
     """Download the Bulk API result file for a single batch,
     and remove it when the context manager exits."""
+    http = session or requests
     try:
         (handle, path) = tempfile.mkstemp(text=False)
-        resp = requests.get(uri, headers=bulk_api.headers(), stream=True)
+        resp = http.get(uri, headers=bulk_api.headers(), stream=True)
         resp.raise_for_status()
         f = os.fdopen(handle, "wb")
-        for chunk in resp.iter_content(chunk_size=chunk_size):  # VCR needs a chunk_size
-            # specific chunk_size seems to make no measurable perf difference
+        # VCR needs a chunk_size. Large chunks keep the number of writes
+        # per result file low.
+        for chunk in resp.iter_content(chunk_size=chunk_size):
             f.write(chunk)
 
         f.close()
@@ -93,34 +131,108 @@ def download_file(uri, bulk_api, *, chunk_size=8192):
         pathlib.Path(path).unlink()
 
 
+def _record_projector(fields):
+    """Return a function that extracts the given fields, in order, from a
+    record dict as a list."""
+    getter = operator.itemgetter(*fields)
+    if len(fields) == 1:
+        return lambda record: [getter(record)]
+    return lambda record: list(getter(record))
+
+
+class _JobStateTags(NamedTuple):
+    """Namespaced tags of the Bulk API batch info elements read by _parse_job_state."""
+
+    state: str
+    state_message: str
+    failed: str
+    processed: str
+
+
 class BulkJobMixin:
     """Provides mixin utilities for classes that manage Bulk API jobs."""
 
+    _session = None
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled HTTP session used for all direct Bulk API reads of this job."""
+        if self._session is None:
+            self._session = _new_bulk_session()
+        return self._session
+
+    def _close_session(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
     def _job_state_from_batches(self, job_id):
         """Query for batches under job_id and return overall status
         inferred from batch-level status values."""
         uri = f"{self.bulk.endpoint}/job/{job_id}/batch"
-        response = requests.get(uri, headers=self.bulk.headers())
-        response.raise_for_status()
-        return self._parse_job_state(response.content)
-
-    def _parse_job_state(self, xml: str):
-        """Parse the Bulk API return value and generate a summary status record for the job."""
-        tree = lxml_parse_string(xml)
-        statuses = [el.text for el in tree.iterfind(".//{%s}state" % self.bulk.jobNS)]
-        state_messages = [
-            el.text for el in tree.iterfind(".//{%s}stateMessage" % self.bulk.jobNS)
-        ]
-
-        # Get how many total records failed across all the batches.
-        failures = tree.findall(".//{%s}numberRecordsFailed" % self.bulk.jobNS)
-        record_failure_count = sum([int(failure.text) for failure in (failures or [])])
-
-        # Get how many total records processed across all the batches.
-        processed = tree.findall(".//{%s}numberRecordsProcessed" % self.bulk.jobNS)
-        records_processed_count = sum(
-            [int(processed.text) for processed in (processed or [])]
+        response = self.session.get(uri, headers=self.bulk.headers(), stream=True)
+        try:
+            response.raise_for_status()
+            # Parse the batch list as it arrives instead of buffering it.
+            response.raw.decode_content = True
+            return self._parse_job_state(response.raw)
+        finally:
+            response.close()
+
+    @cached_property
+    def _ns_tags(self) -> _JobStateTags:
+        return _JobStateTags(
+            *(
+                "{%s}%s" % (self.bulk.jobNS, name)
+                for name in (
+                    "state",
+                    "stateMessage",
+                    "numberRecordsFailed",
+                    "numberRecordsProcessed",
+                )
+            )
         )
+
+    def _parse_job_state(self, xml):
+        """Parse the Bulk API return value and generate a summary status record for the job.
+
+        The batch info may be given as bytes, str or a binary file-like object."""
+        if isinstance(xml, str):
+            xml = xml.encode("utf-8")
+        if isinstance(xml, bytes):
+            xml = io.BytesIO(xml)
+
+        state_tag, state_message_tag, failed_tag, processed_tag = self._ns_tags
+
+        statuses = []
+        state_messages = []
+        record_failure_count = 0
+        records_processed_count = 0
+
+        # Collect all four values in a single streaming pass over the document,
+        # discarding each element once it has been read.
+        for _, el in lxml_etree.iterparse(
+            xml,
+            events=("end",),
+            tag=self._ns_tags,
+            resolve_entities=False,
+            load_dtd=False,
+            no_network=True,
+        ):
+            if el.tag == state_tag:
+                statuses.append(el.text)
+            elif el.tag == state_message_tag:
+                state_messages.append(el.text)
+            elif el.tag == failed_tag:
+                # Get how many total records failed across all the batches.
+                record_failure_count += int(el.text)
+            else:
+                # Get how many total records processed across all the batches.
+                records_processed_count += int(el.text)
+            el.clear()
+            while el.getprevious() is not None:
+                del el.getparent()[0]
+
         # FIXME: "Not Processed" to be expected for original batch with PK Chunking Query
         # PK Chunking is not currently supported.
         if "Not Processed" in statuses:
@@ -163,7 +275,10 @@ class BulkJobMixin:
 
     def _wait_for_job(self, job_id):
         """Wait for the given job to enter a completed state (success or failure)."""
+        delay = POLL_INTERVAL_FLOOR
+        batches_completed = None
         while True:
+            poll_started = time.monotonic()
             job_status = self.bulk.job_status(job_id)
             self.logger.info(
                 f"Waiting for job {job_id} ({job_status['numberBatchesCompleted']}/{job_status['numberBatchesTotal']} batches complete)"
@@ -172,7 +287,15 @@ class BulkJobMixin:
             if result.status is not DataOperationStatus.IN_PROGRESS:
                 break
 
-            time.sleep(10)
+            # Poll quickly while batches are finishing, and back off while
+            # the job is not making visible progress.
+            if job_status["numberBatchesCompleted"] != batches_completed:
+                batches_completed = job_status["numberBatchesCompleted"]
+                delay = POLL_INTERVAL_FLOOR
+            else:
+                delay = min(delay * POLL_INTERVAL_FACTOR, POLL_INTERVAL_CEILING)
+
+            time.sleep(max(0, delay - (time.monotonic() - poll_started)))
         plural_errors = "Errors" if result.total_row_errors != 1 else "Error"
         errors = (
             f": {result.total_row_errors} {plural_errors}"
@@ -251,16 +374,21 @@ class BulkApiQueryOperation(BaseQueryOperation, BulkJobMixin):
         result_ids = self.bulk.get_query_batch_result_ids(
             self.batch_id, job_id=self.job_id
         )
-        for result_id in result_ids:
-            uri = f"{self.bulk.endpoint}/job/{self.job_id}/batch/{self.batch_id}/result/{result_id}"
+        try:
+            for result_id in result_ids:
+                uri = f"{self.bulk.endpoint}/job/{self.job_id}/batch/{self.batch_id}/result/{result_id}"
 
-            with download_file(uri, self.bulk) as f:
-                reader = csv.reader(f)
-                self.headers = next(reader)
-                if "Records not found for this query" in self.headers:
-                    return
+                # Download entire result file to a temporary file first
+                # to avoid the server dropping connections
+                with download_file(uri, self.bulk, session=self.session) as f:
+                    reader = csv.reader(f)
+                    self.headers = next(reader)
+                    if "Records not found for this query" in self.headers:
+                        return
 
-                yield from reader
+                    yield from reader
+        finally:
+            self._close_session()
 
 
 class RestApiQueryOperation(BaseQueryOperation):
@@ -350,8 +478,6 @@ class BulkApiDmlOperation(BaseDmlOperation, BulkJobMixin):
         self.api_options["batch_size"] = (
             self.api_options.get("batch_size") or DEFAULT_BULK_BATCH_SIZE
         )
-        self.csv_buff = io.StringIO(newline="")
-        self.csv_writer = csv.writer(self.csv_buff, quoting=csv.QUOTE_ALL)
 
     def start(self):
         self.job_id = self.bulk.create_job(
@@ -374,7 +500,8 @@ class BulkApiDmlOperation(BaseDmlOperation, BulkJobMixin):
 
         self.logger.info(f"Retrieving Previous Record Values of {self.sobject}")
         prev_record_values = []
-        relevant_fields = set(self.fields + ["Id"])
+        relevant_fields = tuple(dict.fromkeys(self.fields + ["Id"]))
+        project = _record_projector(relevant_fields)
 
         # Set update key
         update_key = (
@@ -383,38 +510,72 @@ class BulkApiDmlOperation(BaseDmlOperation, BulkJobMixin):
             else "Id"
         )
 
+        query_fields = ", ".join(relevant_fields)
+        update_key_index = self.fields.index(update_key)
         for count, batch in enumerate(
-            self._batch(records, self.api_options["batch_size"])
+            iterate_in_chunks(self.api_options["batch_size"], records)
         ):
             self.context.logger.info(f"Querying batch {count + 1}")
 
-            # Extract update key values from the batch
-            update_key_values = [
-                rec[update_key]
-                for rec in csv.DictReader([line.decode("utf-8") for line in batch])
-            ]
+            # Extract the distinct update key values from the batch, as they
+            # would be written to the uploaded CSV
+            update_key_values = list(
+                dict.fromkeys(
+                    "" if rec[update_key_index] is None else str(rec[update_key_index])
+                    for rec in batch
+                )
+            )
 
-            # Construct the SOQL query
-            query_fields = ", ".join(relevant_fields)
-            query_values = ", ".join(f"'{value}'" for value in update_key_values)
-            query = f"SELECT {query_fields} FROM {self.sobject} WHERE {update_key} IN ({query_values})"
+            # Construct one SOQL query per chunk of update key values
+            queries = []
+            for chunk in iterate_in_chunks(
+                PREV_VALUES_QUERY_CHUNK_SIZE, update_key_values
+            ):
+                queries.append(
+                    format_soql(
+                        f"SELECT {query_fields} FROM {self.sobject} WHERE {update_key} IN {{update_key_values}}",
+                        update_key_values=chunk,
+                    )
+                )
 
-            # Execute the query using Bulk API
-            job_id = self.bulk.create_query_job(self.sobject, contentType="JSON")
-            batch_id = self.bulk.query(job_id, query)
-            self.bulk.wait_for_batch(job_id, batch_id)
-            self.bulk.close_job(job_id)
-            results = self.bulk.get_all_results_for_query_batch(batch_id)
+            # Run the queries concurrently through the REST API, unless one of
+            # them is too long to be sent as a REST query string.
+            if any(
+                len(urllib.parse.quote_plus(query)) > MAX_REST_QUERY_LENGTH
+                for query in queries
+            ):
+                results = self._query_prev_record_values_bulk(queries)
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=PREV_VALUES_QUERY_WORKERS
+                ) as executor:
+                    results = list(
+                        executor.map(self._query_prev_record_values_rest, queries)
+                    )
 
             # Extract relevant fields from results and append to the respective lists
             for result in results:
-                result = json.load(salesforce_bulk.util.IteratorBytesIO(result))
-                prev_record_values.extend(
-                    [[res[key] for key in relevant_fields] for res in result]
-                )
+                prev_record_values.extend(project(res) for res in result)
 
         self.logger.info("Done")
-        return prev_record_values, tuple(relevant_fields)
+        return prev_record_values, relevant_fields
+
+    def _query_prev_record_values_rest(self, query):
+        """Run a single previous-values query through the REST API."""
+        return self.sf.query_all(query)["records"]
+
+    def _query_prev_record_values_bulk(self, queries):
+        """Run the previous-values queries as the batches of a single Bulk API
+        query job, and yield the records of each result file."""
+        job_id = self.bulk.create_query_job(self.sobject, contentType="JSON")
+        batch_ids = [self.bulk.query(job_id, query) for query in queries]
+        for batch_id in batch_ids:
+            self.bulk.wait_for_batch(job_id, batch_id)
+        self.bulk.close_job(job_id)
+
+        for batch_id in batch_ids:
+            for result in self.bulk.get_all_results_for_query_batch(batch_id):
+                yield json.load(salesforce_bulk.util.IteratorBytesIO(result))
 
     def load_records(self, records):
         self.batch_ids = []
@@ -433,71 +594,123 @@ class BulkApiDmlOperation(BaseDmlOperation, BulkJobMixin):
         (2) They do not contain more than n records per batch
         """
         serialized_csv_fields = self._serialize_csv_record(self.fields)
-        len_csv_fields = len(serialized_csv_fields)
+        # Characters available for records once the header row is counted
+        char_budget = char_limit - len(serialized_csv_fields)
 
         # append fields to first row
         batch = [serialized_csv_fields]
-        current_chars = len_csv_fields
+        batch_records = 0
+        remaining_chars = char_budget
         for record in records:
             serialized_record = self._serialize_csv_record(record)
+            record_chars = len(serialized_record)
             # Does the next record put us over the character limit?
-            if len(serialized_record) + current_chars > char_limit:
+            if record_chars > remaining_chars:
                 yield batch
                 batch = [serialized_csv_fields]
-                current_chars = len_csv_fields
+                batch_records = 0
+                remaining_chars = char_budget
 
             batch.append(serialized_record)
-            current_chars += len(serialized_record)
+            batch_records += 1
+            remaining_chars -= record_chars
 
             # yield batch if we're at desired size
-            # -1 due to first row being field names
-            if len(batch) - 1 == n:
+            if batch_records == n:
                 yield batch
                 batch = [serialized_csv_fields]
-                current_chars = len_csv_fields
+                batch_records = 0
+                remaining_chars = char_budget
 
         # give back anything leftover
-        if len(batch) > 1:
+        if batch_records:
             yield batch
 
     def _serialize_csv_record(self, record):
         """Given a list of strings (record) return
         the corresponding record serialized in .csv format"""
-        self.csv_writer.writerow(record)
-        serialized = self.csv_buff.getvalue().encode("utf-8")
-        # flush buffer
-        self.csv_buff.truncate(0)
-        self.csv_buff.seek(0)
-
-        return serialized
+        # Equivalent to csv.writer(quoting=csv.QUOTE_ALL).writerow(), without
+        # the per-row round trip through a StringIO buffer.
+        return (
+            '"'
+            + '","'.join(
+                "" if value is None else str(value).replace('"', '""')
+                for value in record
+            )
+            + '"\r\n'
+        ).encode("utf-8")
 
     def get_results(self):
-        for batch_id in self.batch_ids:
+        # Download the batch result files concurrently, but yield their
+        # rows in batch order. Only a few downloads are kept in flight, so
+        # that no more than that many result files are on disk at once.
+        session = self.session
+        workers = self.api_options.get("download_workers", DEFAULT_DOWNLOAD_WORKERS)
+        batch_ids = iter(self.batch_ids)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
             try:
-                results_url = (
-                    f"{self.bulk.endpoint}/job/{self.job_id}/batch/{batch_id}/result"
-                )
-                # Download entire result file to a temporary file first
-                # to avoid the server dropping connections
-                with download_file(results_url, self.bulk) as f:
-                    self.logger.info(f"Downloaded results for batch {batch_id}")
-
-                    reader = csv.reader(f)
-                    next(reader)  # skip header
-
-                    for row in reader:
-                        success = process_bool_arg(row[1])
-                        created = process_bool_arg(row[2])
-                        yield DataOperationResult(
-                            row[0] if success else None,
-                            success,
-                            row[3] if not success else None,
-                            created,
+                while True:
+                    for batch_id in itertools.islice(batch_ids, workers - len(pending)):
+                        pending.append(
+                            (
+                                batch_id,
+                                executor.submit(
+                                    self._download_results, batch_id, session
+                                ),
+                            )
                         )
-            except Exception as e:
-                raise BulkDataException(
-                    f"Failed to download results for batch {batch_id} ({str(e)})"
-                )
+                    if not pending:
+                        break
+
+                    batch_id, download = pending.popleft()
+                    try:
+                        stack, f = download.result()
+                        # The file is removed as soon as its rows are read.
+                        with stack:
+                            self.logger.info(f"Downloaded results for batch {batch_id}")
+
+                            reader = csv.reader(f)
+                            next(reader)  # skip header
+
+                            for row in reader:
+                                success = process_bool_arg(row[1])
+                                created = process_bool_arg(row[2])
+                                yield DataOperationResult(
+                                    row[0] if success else None,
+                                    success,
+                                    row[3] if not success else None,
+                                    created,
+                                )
+                    except Exception as e:
+                        raise BulkDataException(
+                            f"Failed to download results for batch {batch_id} ({str(e)})"
+                        )
+            finally:
+                # Remove any result files that were downloaded but never read.
+                for _, download in pending:
+                    if not download.cancel() and not download.exception():
+                        download.result()[0].close()
+                self._close_session()
+
+    def _download_results(self, batch_id, session):
+        """Download the result file for a single batch. Returns the open file
+        and an ExitStack which removes it once it has been read."""
+        results_url = f"{self.bulk.endpoint}/job/{self.job_id}/batch/{batch_id}/result"
+        stack = ExitStack()
+        # Download entire result file to a temporary file first
+        # to avoid the server dropping connections
+        f = stack.enter_context(download_file(results_url, self.bulk, session=session))
+        return stack, f
+
+
+# HTTP method of the composite/sobjects request for each REST DML operation.
+_REST_METHOD = {
+    DataOperationType.INSERT: "POST",
+    DataOperationType.UPDATE: "PATCH",
+    DataOperationType.DELETE: "DELETE",
+    DataOperationType.UPSERT: "PATCH",
+}
 
 
 class RestApiDmlOperation(BaseDmlOperation):
@@ -512,12 +725,20 @@ class RestApiDmlOperation(BaseDmlOperation):
             fields=fields,
         )
 
+        # mapping_parser imports this module, so import its describe cache here.
+        from cumulusci.tasks.bulkdata.mapping_parser import describe_data
+
         # Because we send values in JSON, we must convert Booleans and nulls
-        describe = {
-            field["name"]: field
-            for field in getattr(context.sf, sobject).describe()["fields"]
-        }
+        describe = describe_data(sobject, context.sf)
         self.boolean_fields = [f for f in fields if describe[f]["type"] == "boolean"]
+        self._boolean_fields = frozenset(self.boolean_fields)
+        self._is_insert = operation is DataOperationType.INSERT
+        self._is_delete = operation is DataOperationType.DELETE
+        self._is_update_or_upsert = operation in (
+            DataOperationType.UPDATE,
+            DataOperationType.UPSERT,
+        )
+        self._attributes = {"type": sobject}
         self.api_options = api_options.copy()
         self.api_options["batch_size"] = (
             self.api_options.get("batch_size") or DEFAULT_REST_BATCH_SIZE
@@ -527,26 +748,26 @@ class RestApiDmlOperation(BaseDmlOperation):
         )
 
     def _record_to_json(self, rec):
-        result = dict(zip(self.fields, rec))
-        for boolean_field in self.boolean_fields:
-            try:
-                result[boolean_field] = process_bool_arg(result[boolean_field] or False)
-            except TypeError as e:
-                raise BulkDataException(e)
-
-        # Remove empty fields (different semantics in REST API)
-        # We do this for insert only - on update, any fields set to `null`
-        # are meant to be blanked out.
-        if self.operation is DataOperationType.INSERT:
-            result = {
-                k: result[k]
-                for k in result
-                if result[k] is not None and result[k] != ""
-            }
-        elif self.operation in (DataOperationType.UPDATE, DataOperationType.UPSERT):
-            result = {k: (result[k] if result[k] != "" else None) for k in result}
-
-        result["attributes"] = {"type": self.sobject}
+        result = {}
+        for field, value in zip(self.fields, rec):
+            if field in self._boolean_fields:
+                try:
+                    value = process_bool_arg(value or False)
+                except TypeError as e:
+                    raise BulkDataException(e)
+
+            # Remove empty fields (different semantics in REST API)
+            # We do this for insert only - on update, any fields set to `null`
+            # are meant to be blanked out.
+            if self._is_insert:
+                if value is None or value == "":
+                    continue
+            elif self._is_update_or_upsert and value == "":
+                value = None
+
+            result[field] = value
+
+        result["attributes"] = self._attributes
         return result
 
     def get_prev_record_values(self, records):
@@ -557,7 +778,8 @@ class RestApiDmlOperation(BaseDmlOperation):
 
         self.logger.info(f"Retrieving Previous Record Values of {self.sobject}")
         prev_record_values = []
-        relevant_fields = set(self.fields + ["Id"])
+        relevant_fields = tuple(dict.fromkeys(self.fields + ["Id"]))
+        project = _record_projector(relevant_fields)
 
         # Set update key
         update_key = (
@@ -566,62 +788,91 @@ class RestApiDmlOperation(BaseDmlOperation):
             else "Id"
         )
 
+        query_fields = ", ".join(relevant_fields)
         for chunk in iterate_in_chunks(self.api_options.get("batch_size"), records):
-            update_key_values = tuple(
-                filter(None, (self._record_to_json(rec)[update_key] for rec in chunk))
+            # Extract the distinct, non-empty update key values from the chunk
+            update_key_values = list(
+                dict.fromkeys(
+                    filter(
+                        None, (self._record_to_json(rec)[update_key] for rec in chunk)
+                    )
+                )
             )
+            if not update_key_values:
+                continue
 
             # Construct the query string
-            query_fields = ", ".join(relevant_fields)
-            query = f"SELECT {query_fields} FROM {self.sobject} WHERE {update_key} IN {update_key_values}"
+            query = format_soql(
+                f"SELECT {query_fields} FROM {self.sobject} WHERE {update_key} IN {{update_key_values}}",
+                update_key_values=update_key_values,
+            )
 
             # Execute the query
             results = self.sf.query(query)
 
             # Extract relevant fields from results and extend the list
-            prev_record_values.extend(
-                [[res[key] for key in relevant_fields] for res in results["records"]]
-            )
+            prev_record_values.extend(project(res) for res in results["records"])
 
         self.logger.info("Done")
-        return prev_record_values, tuple(relevant_fields)
+        return prev_record_values, relevant_fields
 
     def load_records(self, records):
         """Load, update, upsert or delete records into the org"""
 
         self.results = []
-        method = {
-            DataOperationType.INSERT: "POST",
-            DataOperationType.UPDATE: "PATCH",
-            DataOperationType.DELETE: "DELETE",
-            DataOperationType.UPSERT: "PATCH",
-        }[self.operation]
+        method = _REST_METHOD[self.operation]
 
         update_key = self.api_options.get("update_key")
-        for chunk in iterate_in_chunks(self.api_options.get("batch_size"), records):
-            if self.operation is DataOperationType.DELETE:
-                url_string = "?ids=" + ",".join(
-                    self._record_to_json(rec)["Id"] for rec in chunk
-                )
-                json = None
-            else:
-                if update_key:
-                    assert self.operation == DataOperationType.UPSERT
-                    url_string = f"/{self.sobject}/{update_key}"
+
+        def _requests():
+            for chunk in iterate_in_chunks(self.api_options.get("batch_size"), records):
+                if self._is_delete:
+                    url_string = "?ids=" + ",".join(
+                        self._record_to_json(rec)["Id"] for rec in chunk
+                    )
+                    json = None
                 else:
-                    url_string = ""
-                json = {
-                    "allOrNone": False,
-                    "records": [self._record_to_json(rec) for rec in chunk],
-                }
-
-            self.results.extend(
-                self.sf.restful(
-                    f"composite/sobjects{url_string}", method=method, json=json
-                )
+                    if update_key:
+                        assert self.operation == DataOperationType.UPSERT
+                        url_string = f"/{self.sobject}/{update_key}"
+                    else:
+                        url_string = ""
+                    json = {
+                        "allOrNone": False,
+                        "records": [self._record_to_json(rec) for rec in chunk],
+                    }
+                yield f"composite/sobjects{url_string}", json
+
+        # Chunks may be sent several at once, but their results are collected
+        # in chunk order. Only a few requests are kept in flight so that large
+        # record sets are not all serialized up front. Serial mode sends one
+        # chunk at a time, so that records sharing a parent don't contend for
+        # its lock.
+        if self.api_options.get("bulk_mode") == "Serial":
+            workers = 1
+        else:
+            workers = min(
+                self.api_options.get("rest_workers", DEFAULT_REST_WORKERS),
+                MAX_REST_WORKERS,
             )
-
-        row_errors = len([res for res in self.results if not res["success"]])
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            try:
+                for path, payload in _requests():
+                    pending.append(
+                        executor.submit(
+                            self.sf.restful, path, method=method, json=payload
+                        )
+                    )
+                    if len(pending) > workers:
+                        self.results.extend(pending.popleft().result())
+                while pending:
+                    self.results.extend(pending.popleft().result())
+            finally:
+                for request in pending:
+                    request.cancel()
+
+        row_errors = sum(1 for res in self.results if not res["success"])
         self.job_result = DataOperationJobResult(
             DataOperationStatus.SUCCESS
             if not row_errors
@@ -644,9 +895,9 @@ class RestApiDmlOperation(BaseDmlOperation):
             else:
                 errors = ""
 
-            if self.operation == DataOperationType.INSERT:
+            if self._is_insert:
                 created = True
-            elif self.operation == DataOperationType.UPDATE:
+            elif self.operation is DataOperationType.UPDATE:
                 created = False
             else:
                 created = res.get("created")
@@ -656,6 +907,22 @@ class RestApiDmlOperation(BaseDmlOperation):
         yield from (_convert(res) for res in self.results)
 
 
+def get_record_counts(sf, sobjects: Iterable[str]) -> Dict[str, int]:
+    """Look up the record counts of several sObjects with a single Record Count
+    API call. sObjects the API does not report are omitted from the result."""
+    sobjects = list(dict.fromkeys(sobjects))
+    # The Record Count endpoint requires API 40.0. REST Collections requires 42.0.
+    if not sobjects or float(sf.sf_version) < 42.0:
+        return {}
+
+    record_count_response = sf.restful(
+        f"limits/recordCount?sObjects={','.join(sobjects)}"
+    )
+    return {
+        entry["name"]: entry["count"] for entry in record_count_response["sObjects"]
+    }
+
+
 def get_query_operation(
     *,
     sobject: str,
@@ -664,10 +931,15 @@ def get_query_operation(
     context: Any,
     query: str,
     api: Optional[DataApi] = DataApi.SMART,
+    record_counts: Optional[Dict[str, int]] = None,
 ) -> BaseQueryOperation:
     """Create an appropriate QueryOperation instance for the given parameters, selecting
     between REST and Bulk APIs based upon volume (Bulk > 2000 records) if DataApi.SMART
-    is provided."""
+    is provided.
+
+    Callers creating operations for several sObjects can pass record_counts, as
+    returned by get_record_counts() for all of them, to avoid a Record Count API
+    call per operation."""
 
     # The Record Count endpoint requires API 40.0. REST Collections requires 42.0.
     api_version = float(context.sf.sf_version)
@@ -675,17 +947,9 @@ def get_query_operation(
         api = DataApi.BULK
 
     if api in (DataApi.SMART, None):
-        record_count_response = context.sf.restful(
-            f"limits/recordCount?sObjects={sobject}"
-        )
-        sobject_map = {
-            entry["name"]: entry["count"] for entry in record_count_response["sObjects"]
-        }
-        api = (
-            DataApi.BULK
-            if sobject in sobject_map and sobject_map[sobject] >= 2000
-            else DataApi.REST
-        )
+        if record_counts is None:
+            record_counts = get_record_counts(context.sf, [sobject])
+        api = DataApi.BULK if record_counts.get(sobject, 0) >= 2000 else DataApi.REST
 
     if api is DataApi.BULK:
         return BulkApiQueryOperation(
@@ -59,3 +59,13 @@ class TestBaseBatchDataTask:
             gen_data.assert_called_once_with(
                 "sqlite:///generated_data.db", mock.ANY, 20, 0
             )
+
+    def test_init_db__sqlite_pragmas(self):
+        with temporary_dir() as d:
+            dburl = "sqlite:///" + os.path.join(d, "temp.db")
+            session, engine, base = BaseGenerateDataTask.init_db(dburl, {})
+            with engine.connect() as connection:
+                assert connection.execute("PRAGMA journal_mode").scalar() == "memory"
+                assert connection.execute("PRAGMA synchronous").scalar() == 0
+            session.close()
+            engine.dispose()
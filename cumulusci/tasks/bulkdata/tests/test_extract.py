@@ -1021,6 +1021,30 @@ class TestExtractData:
             == "SELECT Id, Test__c FROM Contact WHERE RecordType.DeveloperName = 'Devel'"
         )
 
+    @mock.patch("cumulusci.tasks.bulkdata.extract.get_record_counts")
+    def test_run_task__record_counts(self, record_counts_mock):
+        task = _make_task(
+            ExtractData, {"options": {"database_url": "sqlite:///", "mapping": ""}}
+        )
+        task.sf = mock.Mock()
+        task.mapping = {
+            "Accounts": MappingStep(sf_object="Account"),
+            "Contacts": MappingStep(sf_object="Contact", api="bulk"),
+            "Leads": MappingStep(sf_object="Lead", api="rest"),
+            "Opportunities": MappingStep(sf_object="Opportunity"),
+        }
+        task._init_mapping = mock.Mock()
+        task._init_db = mock.MagicMock()
+        task._run_query = mock.Mock()
+        task._map_autopks = mock.Mock()
+
+        task._run_task()
+
+        record_counts_mock.assert_called_once()
+        assert list(record_counts_mock.call_args.args[1]) == ["Account", "Opportunity"]
+        for query_call in task._run_query.call_args_list:
+            assert query_call.args[2] is record_counts_mock.return_value
+
     @mock.patch("cumulusci.tasks.bulkdata.extract.get_query_operation")
     def test_run_query(self, query_op_mock):
         task = _make_task(
@@ -1040,6 +1064,7 @@ class TestExtractData:
             api_options={},
             context=task,
             query="SELECT Id FROM Contact",
+            record_counts=None,
         )
         query_op_mock.return_value.query.assert_called_once_with()
         task._import_results.assert_called_once_with(
@@ -1065,6 +1090,7 @@ class TestExtractData:
             api_options={},
             context=task,
             query="SELECT Id FROM Contact",
+            record_counts=None,
         )
         query_op_mock.return_value.query.assert_called_once_with()
         task._import_results.assert_not_called()
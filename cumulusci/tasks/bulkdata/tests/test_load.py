@@ -423,6 +423,34 @@ class TestLoadData:
         with pytest.raises(TaskOptionsError):
             _make_task(LoadData, {"options": {"bulk_mode": "Test"}})
 
+    def test_init_options__rest_workers_wrong(self):
+        with pytest.raises(TaskOptionsError):
+            _make_task(LoadData, {"options": {"rest_workers": "0"}})
+
+    @mock.patch("cumulusci.tasks.bulkdata.load.get_dml_operation")
+    def test_configure_step__rest_workers(self, mock_dml):
+        task = _make_task(
+            LoadData,
+            {
+                "options": {
+                    "database_url": "sqlite://",
+                    "mapping": "mapping.yml",
+                    "rest_workers": "3",
+                }
+            },
+        )
+        task._query_db = mock.Mock()
+
+        task.configure_step(
+            MappingStep(sf_object="Account", fields={"Name": "Name"}, api="rest")
+        )
+
+        assert mock_dml.call_args.kwargs["api_options"] == {
+            "batch_size": None,
+            "bulk_mode": "Parallel",
+            "rest_workers": 3,
+        }
+
     def test_init_options__database_url(self):
         t = _make_task(
             LoadData,
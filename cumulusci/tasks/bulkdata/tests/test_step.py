@@ -1,13 +1,19 @@
+import csv
 import io
 import json
+import pathlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import pytest
+import requests
 import responses
 
 from cumulusci.core.exceptions import BulkDataException
 from cumulusci.tasks.bulkdata.load import LoadData
 from cumulusci.tasks.bulkdata.step import (
+    MAX_REST_WORKERS,
     BulkApiDmlOperation,
     BulkApiQueryOperation,
     BulkJobMixin,
@@ -21,10 +27,25 @@ from cumulusci.tasks.bulkdata.step import (
     download_file,
     get_dml_operation,
     get_query_operation,
+    get_record_counts,
 )
 from cumulusci.tasks.bulkdata.tests.utils import _make_task
 from cumulusci.tests.util import CURRENT_SF_API_VERSION, mock_describe_calls
 
+
+def _body_contains(text):
+    """responses matcher for requests whose body includes the given text,
+    to tell apart REST chunks which are sent concurrently."""
+
+    def match(request):
+        body = request.body or b""
+        if isinstance(body, bytes):
+            body = body.decode("utf-8")
+        return text in body, f"Request body does not include {text}"
+
+    return match
+
+
 BULK_BATCH_RESPONSE = """<root xmlns="http://ns">
 <batch>
     <state>{first_state}</state>
@@ -49,6 +70,30 @@ class TestDownloadFile:
             # make sure it was decoded as utf-8
             assert f.read() == "TEST\u2014"
 
+    @responses.activate
+    def test_download_file__removes_file(self):
+        url = "https://example.com"
+        bulk_mock = mock.Mock()
+        bulk_mock.headers.return_value = {}
+
+        responses.add(method="GET", url=url, body=b"TEST\xe2\x80\x94")
+        with download_file(url, bulk_mock) as f:
+            path = pathlib.Path(f.name)
+            assert f.read() == "TEST\u2014"
+        assert not path.exists()
+
+    @responses.activate
+    def test_download_file__session(self):
+        url = "https://example.com"
+        bulk_mock = mock.Mock()
+        bulk_mock.headers.return_value = {}
+        session = mock.Mock(wraps=requests.Session())
+
+        responses.add(method="GET", url=url, body=b"TEST")
+        with download_file(url, bulk_mock, session=session) as f:
+            assert f.read() == "TEST"
+        session.get.assert_called_once_with(url, headers={}, stream=True)
+
 
 class TestBulkDataJobTaskMixin:
     @responses.activate
@@ -57,7 +102,7 @@ class TestBulkDataJobTaskMixin:
         mixin.bulk = mock.Mock()
         mixin.bulk.endpoint = "https://example.com"
         mixin.bulk.headers.return_value = {"HEADER": "test"}
-        mixin._parse_job_state = mock.Mock()
+        mixin._parse_job_state = mock.Mock(side_effect=lambda stream: stream.read())
 
         responses.add(
             "GET",
@@ -65,10 +110,19 @@ class TestBulkDataJobTaskMixin:
             adding_headers=mixin.bulk.headers.return_value,
             body="TEST",
         )
-        assert (
-            mixin._job_state_from_batches("JOB") == mixin._parse_job_state.return_value
-        )
-        mixin._parse_job_state.assert_called_once_with(b"TEST")
+        assert mixin._job_state_from_batches("JOB") == b"TEST"
+        mixin._parse_job_state.assert_called_once()
+
+    def test_session(self):
+        mixin = BulkJobMixin()
+        session = mixin.session
+        assert mixin.session is session
+        assert session.get_adapter("https://example.com")._pool_maxsize == 32
+
+        with mock.patch.object(session, "close") as close:
+            mixin._close_session()
+        close.assert_called_once_with()
+        assert mixin.session is not session
 
     def test_parse_job_state(self):
         mixin = BulkJobMixin()
@@ -174,6 +228,61 @@ class TestBulkDataJobTaskMixin:
             DataOperationStatus.ROW_FAILURE, [], 10, 200
         ), "Single batch"
 
+    def test_parse_job_state__bytes(self):
+        mixin = BulkJobMixin()
+        mixin.bulk = mock.Mock()
+        mixin.bulk.jobNS = "http://ns"
+
+        assert mixin._parse_job_state(
+            b'<root xmlns="http://ns">'
+            b"  <batch>"
+            b"    <id>751000000000001</id>"
+            b"    <state>Failed</state>"
+            b"    <stateMessage>Bad \xe2\x80\x94 worse</stateMessage>"
+            b"    <numberRecordsProcessed>10</numberRecordsProcessed>"
+            b"    <numberRecordsFailed>3</numberRecordsFailed>"
+            b"  </batch>"
+            b"  <batch>"
+            b"    <id>751000000000002</id>"
+            b"    <state>Completed</state>"
+            b"    <numberRecordsProcessed>5</numberRecordsProcessed>"
+            b"    <numberRecordsFailed>0</numberRecordsFailed>"
+            b"  </batch>"
+            b"</root>"
+        ) == DataOperationJobResult(
+            DataOperationStatus.JOB_FAILURE, ["Bad \u2014 worse"], 15, 3
+        )
+
+    def test_parse_job_state__stream(self):
+        mixin = BulkJobMixin()
+        mixin.bulk = mock.Mock()
+        mixin.bulk.jobNS = "http://ns"
+
+        assert mixin._parse_job_state(
+            io.BytesIO(
+                b'<root xmlns="http://ns">'
+                b"  <batch>"
+                b"    <state>Completed</state>"
+                b"    <numberRecordsProcessed>10</numberRecordsProcessed>"
+                b"    <numberRecordsFailed>0</numberRecordsFailed>"
+                b"  </batch>"
+                b"</root>"
+            )
+        ) == DataOperationJobResult(DataOperationStatus.SUCCESS, [], 10, 0)
+
+    def test_ns_tags(self):
+        mixin = BulkJobMixin()
+        mixin.bulk = mock.Mock()
+        mixin.bulk.jobNS = "http://ns"
+
+        assert mixin._ns_tags == (
+            "{http://ns}state",
+            "{http://ns}stateMessage",
+            "{http://ns}numberRecordsFailed",
+            "{http://ns}numberRecordsProcessed",
+        )
+        assert mixin._ns_tags is mixin._ns_tags
+
     @mock.patch("time.sleep")
     def test_wait_for_job(self, sleep_patch):
         mixin = BulkJobMixin()
@@ -197,6 +306,30 @@ class TestBulkDataJobTaskMixin:
         )
         assert result.status is DataOperationStatus.SUCCESS
 
+    @mock.patch("cumulusci.tasks.bulkdata.step.POLL_INTERVAL_CEILING", 4)
+    @mock.patch("cumulusci.tasks.bulkdata.step.POLL_INTERVAL_FLOOR", 1)
+    @mock.patch("time.monotonic", return_value=0)
+    @mock.patch("time.sleep")
+    def test_wait_for_job__backoff(self, sleep_patch, monotonic_patch):
+        mixin = BulkJobMixin()
+
+        mixin.bulk = mock.Mock()
+        mixin.bulk.job_status.side_effect = [
+            {"numberBatchesCompleted": completed, "numberBatchesTotal": 3}
+            for completed in (0, 0, 0, 0, 1, 1, 3)
+        ]
+        in_progress = DataOperationJobResult(DataOperationStatus.IN_PROGRESS, [], 0, 0)
+        mixin._job_state_from_batches = mock.Mock(
+            side_effect=[in_progress] * 6
+            + [DataOperationJobResult(DataOperationStatus.SUCCESS, [], 0, 0)]
+        )
+        mixin.logger = mock.Mock()
+
+        result = mixin._wait_for_job("750000000000000")
+
+        assert result.status is DataOperationStatus.SUCCESS
+        assert [c.args[0] for c in sleep_patch.call_args_list] == [1, 2, 4, 4, 1, 2]
+
     def test_wait_for_job__failed(self):
         mixin = BulkJobMixin()
 
@@ -332,7 +465,9 @@ class TestBulkApiQueryOperation:
             "BATCH", job_id="JOB"
         )
         download_mock.assert_called_once_with(
-            "https://test/job/JOB/batch/BATCH/result/RESULT", context.bulk
+            "https://test/job/JOB/batch/BATCH/result/RESULT",
+            context.bulk,
+            session=mock.ANY,
         )
 
         assert list(results) == [
@@ -368,7 +503,9 @@ class TestBulkApiQueryOperation:
             "BATCH", job_id="JOB"
         )
         download_mock.assert_called_once_with(
-            "https://test/job/JOB/batch/BATCH/result/RESULT", context.bulk
+            "https://test/job/JOB/batch/BATCH/result/RESULT",
+            context.bulk,
+            session=mock.ANY,
         )
 
         assert list(results) == []
@@ -498,6 +635,27 @@ class TestBulkApiDmlOperation:
         serialized = step._serialize_csv_record(record)
         assert serialized == b'"col1","multiline\ncol2"\r\n'
 
+    @pytest.mark.parametrize(
+        "record",
+        [
+            ["a,b", 'say "hi"', '""'],
+            ["multi\r\nline", "\u2014", ""],
+            [None, 1, 2.5, True],
+        ],
+    )
+    def test_serialize_csv_record__matches_csv_writer(self, record):
+        step = BulkApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={},
+            context=mock.Mock(),
+            fields=["A", "B", "C"],
+        )
+        buff = io.StringIO(newline="")
+        csv.writer(buff, quoting=csv.QUOTE_ALL).writerow(record)
+
+        assert step._serialize_csv_record(record) == buff.getvalue().encode("utf-8")
+
     def test_get_prev_record_values(self):
         context = mock.Mock()
         step = BulkApiDmlOperation(
@@ -508,7 +666,10 @@ class TestBulkApiDmlOperation:
             fields=["LastName"],
         )
         results = [
-            [{"LastName": "Test1", "Id": "Id1"}, {"LastName": "Test2", "Id": "Id2"}]
+            [
+                b'[{"LastName": "Test1", "Id": "Id1"}, ',
+                b'{"LastName": "Test2", "Id": "Id2"}]',
+            ]
         ]
         expected_record_values = [["Test1", "Id1"], ["Test2", "Id2"]]
         expected_relevant_fields = ("Id", "LastName")
@@ -520,9 +681,7 @@ class TestBulkApiDmlOperation:
         step.bulk.get_all_results_for_query_batch.return_value = results
 
         records = iter([["Test1"], ["Test2"], ["Test3"]])
-        with mock.patch("json.load", side_effect=lambda result: result), mock.patch(
-            "salesforce_bulk.util.IteratorBytesIO", side_effect=lambda result: result
-        ):
+        with mock.patch("cumulusci.tasks.bulkdata.step.MAX_REST_QUERY_LENGTH", 0):
             prev_record_values, relevant_fields = step.get_prev_record_values(records)
 
         assert sorted(map(sorted, prev_record_values)) == sorted(
@@ -533,6 +692,101 @@ class TestBulkApiDmlOperation:
             "Contact", contentType="JSON"
         )
         step.bulk.get_all_results_for_query_batch.assert_called_once_with("BATCH_ID")
+        step.sf.query_all.assert_not_called()
+
+    def test_get_prev_record_values__id_only(self):
+        context = mock.Mock()
+        step = BulkApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.UPDATE,
+            api_options={"batch_size": 10},
+            context=context,
+            fields=["Id"],
+        )
+        step.sf.query_all.return_value = {
+            "records": [{"attributes": {}, "Id": "003000000000001"}]
+        }
+
+        prev_record_values, relevant_fields = step.get_prev_record_values(
+            iter([["003000000000001"]])
+        )
+
+        assert relevant_fields == ("Id",)
+        assert prev_record_values == [["003000000000001"]]
+        assert step.sf.query_all.call_args.args[0].startswith("SELECT Id FROM Contact")
+
+    @mock.patch("cumulusci.tasks.bulkdata.step.PREV_VALUES_QUERY_CHUNK_SIZE", 2)
+    def test_get_prev_record_values__rest_queries(self):
+        context = mock.Mock()
+        step = BulkApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.UPSERT,
+            api_options={"batch_size": 10, "update_key": "LastName"},
+            context=context,
+            fields=["LastName"],
+        )
+        step.sf.query_all.side_effect = [
+            {
+                "records": [
+                    {"attributes": {}, "LastName": "Test1", "Id": "Id1"},
+                    {"attributes": {}, "LastName": "Test2", "Id": "Id2"},
+                ]
+            },
+            {"records": [{"attributes": {}, "LastName": "Test3", "Id": "Id3"}]},
+        ]
+
+        records = iter([["Test1"], ["Test2"], ["Test1"], ["Test3"]])
+        prev_record_values, relevant_fields = step.get_prev_record_values(records)
+
+        assert prev_record_values == [
+            ["Test1", "Id1"],
+            ["Test2", "Id2"],
+            ["Test3", "Id3"],
+        ]
+        assert relevant_fields == ("LastName", "Id")
+        queries = [c.args[0] for c in step.sf.query_all.call_args_list]
+        assert len(queries) == 2
+        assert queries[0].endswith("WHERE LastName IN ('Test1','Test2')")
+        assert queries[1].endswith("WHERE LastName IN ('Test3')")
+        step.bulk.create_query_job.assert_not_called()
+
+    @mock.patch("cumulusci.tasks.bulkdata.step.PREV_VALUES_QUERY_CHUNK_SIZE", 2)
+    @mock.patch("cumulusci.tasks.bulkdata.step.MAX_REST_QUERY_LENGTH", 0)
+    def test_get_prev_record_values__bulk_batches(self):
+        context = mock.Mock()
+        step = BulkApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.UPSERT,
+            api_options={"batch_size": 10, "update_key": "LastName"},
+            context=context,
+            fields=["LastName"],
+        )
+        step.bulk.create_query_job.return_value = "JOB_ID"
+        step.bulk.query.side_effect = ["BATCH1", "BATCH2"]
+        step.bulk.get_all_results_for_query_batch.side_effect = [
+            [
+                [
+                    b'[{"LastName": "Test1", "Id": "Id1"}, ',
+                    b'{"LastName": "Test2", "Id": "Id2"}]',
+                ]
+            ],
+            [[b'[{"LastName": "Test3", "Id": "Id3"}]']],
+        ]
+
+        records = iter([["Test1"], ["Test2"], ["Test3"]])
+        prev_record_values, _ = step.get_prev_record_values(records)
+
+        assert prev_record_values == [
+            ["Test1", "Id1"],
+            ["Test2", "Id2"],
+            ["Test3", "Id3"],
+        ]
+        # One query job, with a batch for each chunk of update key values
+        step.bulk.create_query_job.assert_called_once_with(
+            "Contact", contentType="JSON"
+        )
+        assert [c.args[0] for c in step.bulk.query.call_args_list] == ["JOB_ID"] * 2
+        step.bulk.close_job.assert_called_once_with("JOB_ID")
 
     def test_batch(self):
         context = mock.Mock()
@@ -597,17 +851,16 @@ class TestBulkApiDmlOperation:
     def test_get_results(self, download_mock):
         context = mock.Mock()
         context.bulk.endpoint = "https://test"
-        download_mock.side_effect = [
-            io.StringIO(
-                """id,success,created,error
+        result_files = {
+            "https://test/job/JOB/batch/BATCH1/result": """id,success,created,error
 003000000000001,true,true,
-003000000000002,true,true,"""
-            ),
-            io.StringIO(
-                """id,success,created,error
-003000000000003,false,false,error"""
-            ),
-        ]
+003000000000002,true,true,""",
+            "https://test/job/JOB/batch/BATCH2/result": """id,success,created,error
+003000000000003,false,false,error""",
+        }
+        download_mock.side_effect = lambda url, *args, **kwargs: io.StringIO(
+            result_files[url]
+        )
 
         step = BulkApiDmlOperation(
             sobject="Contact",
@@ -628,11 +881,78 @@ class TestBulkApiDmlOperation:
         ]
         download_mock.assert_has_calls(
             [
-                mock.call("https://test/job/JOB/batch/BATCH1/result", context.bulk),
-                mock.call("https://test/job/JOB/batch/BATCH2/result", context.bulk),
-            ]
+                mock.call(
+                    "https://test/job/JOB/batch/BATCH1/result",
+                    context.bulk,
+                    session=mock.ANY,
+                ),
+                mock.call(
+                    "https://test/job/JOB/batch/BATCH2/result",
+                    context.bulk,
+                    session=mock.ANY,
+                ),
+            ],
+            any_order=True,
         )
 
+    @mock.patch("cumulusci.tasks.bulkdata.step.download_file")
+    def test_get_results__removes_unread_files(self, download_mock):
+        context = mock.Mock()
+        context.bulk.endpoint = "https://test"
+        files = {}
+
+        def download(url, *args, **kwargs):
+            files[url] = mock.MagicMock()
+            files[url].__enter__.return_value = io.StringIO(
+                "id,success,created,error\nbad"
+            )
+            return files[url]
+
+        download_mock.side_effect = download
+
+        step = BulkApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={"download_workers": 2},
+            context=context,
+            fields=["LastName"],
+        )
+        step.job_id = "JOB"
+        step.batch_ids = ["BATCH1", "BATCH2", "BATCH3"]
+
+        with pytest.raises(BulkDataException, match="BATCH1"):
+            list(step.get_results())
+
+        # Downloads that had not started yet may have been cancelled instead
+        assert "https://test/job/JOB/batch/BATCH1/result" in files
+        for f in files.values():
+            f.__exit__.assert_called_once()
+
+    @mock.patch("cumulusci.tasks.bulkdata.step.download_file")
+    def test_get_results__bounded_downloads(self, download_mock):
+        context = mock.Mock()
+        context.bulk.endpoint = "https://test"
+        download_mock.side_effect = lambda *args, **kwargs: io.StringIO(
+            "id,success,created,error\n003000000000001,true,true,"
+        )
+
+        step = BulkApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={"download_workers": 2},
+            context=context,
+            fields=["LastName"],
+        )
+        step.job_id = "JOB"
+        step.batch_ids = ["BATCH1", "BATCH2", "BATCH3", "BATCH4"]
+
+        results = step.get_results()
+        next(results)
+
+        assert download_mock.call_count <= 2
+        assert len(list(results)) == 3
+        assert download_mock.call_count == 4
+
     @mock.patch("cumulusci.tasks.bulkdata.step.download_file")
     def test_get_results__failure(self, download_mock):
         context = mock.Mock()
@@ -791,12 +1111,14 @@ class TestRestApiDmlOperation:
                 {"id": "003000000000002", "success": True},
             ],
             status=200,
+            match=[_body_contains("Narvaez")],
         )
         responses.add(
             responses.POST,
             url=f"https://example.com/services/data/v{CURRENT_SF_API_VERSION}/composite/sobjects",
             json=[{"id": "003000000000003", "success": True}],
             status=200,
+            match=[_body_contains("Aito")],
         )
 
         recs = [["Fred", "Narvaez"], [None, "De Vries"], ["Hiroko", "Aito"]]
@@ -879,6 +1201,138 @@ class TestRestApiDmlOperation:
         )
         assert set(relevant_fields) == set(expected_relevant_fields)
 
+    @pytest.mark.parametrize(
+        "operation,record,expected",
+        [
+            (
+                DataOperationType.INSERT,
+                [None, "", ""],
+                {"IsActive__c": False, "attributes": {"type": "Contact"}},
+            ),
+            (
+                DataOperationType.UPDATE,
+                ["003000000000001", "", None],
+                {
+                    "Id": "003000000000001",
+                    "LastName": None,
+                    "IsActive__c": False,
+                    "attributes": {"type": "Contact"},
+                },
+            ),
+            (
+                DataOperationType.DELETE,
+                ["003000000000001", "", None],
+                {
+                    "Id": "003000000000001",
+                    "LastName": "",
+                    "IsActive__c": False,
+                    "attributes": {"type": "Contact"},
+                },
+            ),
+        ],
+    )
+    def test_record_to_json__empty_values(self, operation, record, expected):
+        context = mock.Mock()
+        context.sf.Contact.describe.return_value = {
+            "fields": [
+                {"name": "Id", "type": "id"},
+                {"name": "LastName", "type": "string"},
+                {"name": "IsActive__c", "type": "boolean"},
+            ]
+        }
+        step = RestApiDmlOperation(
+            sobject="Contact",
+            operation=operation,
+            api_options={},
+            context=context,
+            fields=["Id", "LastName", "IsActive__c"],
+        )
+
+        assert step._record_to_json(record) == expected
+
+    def test_describe_is_cached(self):
+        context = mock.Mock()
+        context.sf.Contact.describe.return_value = {
+            "fields": [
+                {"name": "LastName", "type": "string"},
+                {"name": "IsActive__c", "type": "boolean"},
+            ]
+        }
+
+        for operation in (DataOperationType.INSERT, DataOperationType.UPDATE):
+            step = RestApiDmlOperation(
+                sobject="Contact",
+                operation=operation,
+                api_options={},
+                context=context,
+                fields=["LastName", "IsActive__c"],
+            )
+            assert step.boolean_fields == ["IsActive__c"]
+
+        context.sf.Contact.describe.assert_called_once_with()
+
+    @responses.activate
+    def test_get_prev_record_values__query_values(self):
+        mock_describe_calls()
+        task = _make_task(
+            LoadData,
+            {
+                "options": {
+                    "database_url": "sqlite:///test.db",
+                    "mapping": "mapping.yml",
+                }
+            },
+        )
+        task.project_config.project__package__api_version = CURRENT_SF_API_VERSION
+        task._init_task()
+
+        step = RestApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.UPSERT,
+            api_options={"batch_size": 3, "update_key": "LastName"},
+            context=task,
+            fields=["LastName"],
+        )
+        step.sf.query = mock.Mock()
+        step.sf.query.return_value = {"records": []}
+        records = iter([["O'Neil"], ["Test"], ["O'Neil"], [""], ["Test4"], [""]])
+        step.get_prev_record_values(records)
+
+        assert [
+            c.args[0].split(" WHERE ")[1] for c in step.sf.query.call_args_list
+        ] == [
+            "LastName IN ('O\\'Neil','Test')",
+            "LastName IN ('Test4')",
+        ]
+
+    @responses.activate
+    def test_get_prev_record_values__no_update_keys(self):
+        mock_describe_calls()
+        task = _make_task(
+            LoadData,
+            {
+                "options": {
+                    "database_url": "sqlite:///test.db",
+                    "mapping": "mapping.yml",
+                }
+            },
+        )
+        task.project_config.project__package__api_version = CURRENT_SF_API_VERSION
+        task._init_task()
+
+        step = RestApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.UPSERT,
+            api_options={"batch_size": 10, "update_key": "LastName"},
+            context=task,
+            fields=["LastName"],
+        )
+        step.sf.query = mock.Mock()
+        prev_record_values, _ = step.get_prev_record_values(iter([[""], [""]]))
+
+        assert prev_record_values == []
+        step.sf.query.assert_not_called()
+
     @responses.activate
     def test_insert_dml_operation__boolean_conversion(self):
         mock_describe_calls()
@@ -1045,6 +1499,102 @@ class TestRestApiDmlOperation:
             dml_op.load_records(iter(recs))
         assert "xyzzy" in str(e.value)
 
+    @responses.activate
+    def test_load_records__concurrent_chunks(self):
+        mock_describe_calls()
+        task = _make_task(
+            LoadData,
+            {
+                "options": {
+                    "database_url": "sqlite:///test.db",
+                    "mapping": "mapping.yml",
+                }
+            },
+        )
+        task.project_config.project__package__api_version = CURRENT_SF_API_VERSION
+        task._init_task()
+
+        first_chunk_sent = threading.Event()
+        last_chunk_finished = threading.Event()
+
+        def restful(path, method, json):
+            names = [rec["LastName"] for rec in json["records"]]
+            if names == ["Narvaez"]:
+                # The first chunk only finishes after the last one was sent.
+                first_chunk_sent.set()
+                assert last_chunk_finished.wait(5)
+            elif names == ["Aito"]:
+                last_chunk_finished.set()
+            return [{"id": name, "success": True} for name in names]
+
+        dml_op = RestApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={"batch_size": 1, "rest_workers": 10},
+            context=task,
+            fields=["FirstName", "LastName"],
+        )
+        with mock.patch.object(dml_op.sf, "restful", side_effect=restful), mock.patch(
+            "cumulusci.tasks.bulkdata.step.ThreadPoolExecutor",
+            wraps=ThreadPoolExecutor,
+        ) as executor:
+            dml_op.start()
+            dml_op.load_records(
+                iter([["Fred", "Narvaez"], [None, "De Vries"], ["Hiroko", "Aito"]])
+            )
+            dml_op.end()
+
+        executor.assert_called_once_with(max_workers=MAX_REST_WORKERS)
+        assert first_chunk_sent.is_set()
+        assert [result.id for result in dml_op.get_results()] == [
+            "Narvaez",
+            "De Vries",
+            "Aito",
+        ]
+
+    @pytest.mark.parametrize(
+        "api_options,expected_workers",
+        [
+            ({}, 1),
+            ({"rest_workers": 3}, 3),
+            ({"rest_workers": 3, "bulk_mode": "Serial"}, 1),
+        ],
+    )
+    @responses.activate
+    def test_load_records__workers(self, api_options, expected_workers):
+        mock_describe_calls()
+        task = _make_task(
+            LoadData,
+            {
+                "options": {
+                    "database_url": "sqlite:///test.db",
+                    "mapping": "mapping.yml",
+                }
+            },
+        )
+        task.project_config.project__package__api_version = CURRENT_SF_API_VERSION
+        task._init_task()
+
+        dml_op = RestApiDmlOperation(
+            sobject="Contact",
+            operation=DataOperationType.INSERT,
+            api_options={"batch_size": 1, **api_options},
+            context=task,
+            fields=["FirstName", "LastName"],
+        )
+        with mock.patch.object(
+            dml_op.sf, "restful", return_value=[{"id": "Id1", "success": True}]
+        ), mock.patch(
+            "cumulusci.tasks.bulkdata.step.ThreadPoolExecutor",
+            wraps=ThreadPoolExecutor,
+        ) as executor:
+            dml_op.start()
+            dml_op.load_records(iter([["Fred", "Narvaez"], [None, "De Vries"]]))
+            dml_op.end()
+
+        executor.assert_called_once_with(max_workers=expected_workers)
+        assert len(list(dml_op.get_results())) == 2
+
     @responses.activate
     def test_insert_dml_operation__row_failure(self):
         mock_describe_calls()
@@ -1068,6 +1618,7 @@ class TestRestApiDmlOperation:
                 {"id": "003000000000002", "success": True},
             ],
             status=200,
+            match=[_body_contains("Narvaez")],
         )
         responses.add(
             responses.POST,
@@ -1086,6 +1637,7 @@ class TestRestApiDmlOperation:
                 }
             ],
             status=200,
+            match=[_body_contains("Aito")],
         )
 
         recs = [["Fred", "Narvaez"], [None, "De Vries"], ["Hiroko", "Aito"]]
@@ -1291,6 +1843,57 @@ class TestGetOperationFunctions:
         rest_query.assert_not_called()
         context.sf.restful.assert_called_once_with("limits/recordCount?sObjects=Test")
 
+    @mock.patch("cumulusci.tasks.bulkdata.step.BulkApiQueryOperation")
+    @mock.patch("cumulusci.tasks.bulkdata.step.RestApiQueryOperation")
+    def test_get_query_operation__record_counts(self, rest_query, bulk_query):
+        context = mock.Mock()
+        context.sf.sf_version = "42.0"
+        record_counts = {"Account": 10000}
+
+        for sobject in ("Account", "Contact"):
+            get_query_operation(
+                sobject=sobject,
+                fields=["Id"],
+                api_options={},
+                context=context,
+                query=f"SELECT Id FROM {sobject}",
+                api=DataApi.SMART,
+                record_counts=record_counts,
+            )
+
+        bulk_query.assert_called_once()
+        assert bulk_query.call_args.kwargs["sobject"] == "Account"
+        rest_query.assert_called_once()
+        assert rest_query.call_args.kwargs["sobject"] == "Contact"
+        context.sf.restful.assert_not_called()
+
+    def test_get_record_counts(self):
+        sf = mock.Mock()
+        sf.sf_version = "42.0"
+        sf.restful.return_value = {
+            "sObjects": [
+                {"name": "Account", "count": 10},
+                {"name": "Contact", "count": 5},
+            ]
+        }
+
+        assert get_record_counts(sf, ["Account", "Contact", "Account", "Lead"]) == {
+            "Account": 10,
+            "Contact": 5,
+        }
+        sf.restful.assert_called_once_with(
+            "limits/recordCount?sObjects=Account,Contact,Lead"
+        )
+
+    def test_get_record_counts__skipped(self):
+        sf = mock.Mock()
+        sf.sf_version = "42.0"
+        assert get_record_counts(sf, []) == {}
+
+        sf.sf_version = "41.0"
+        assert get_record_counts(sf, ["Account"]) == {}
+        sf.restful.assert_not_called()
+
     @mock.patch("cumulusci.tasks.bulkdata.step.BulkApiQueryOperation")
     @mock.patch("cumulusci.tasks.bulkdata.step.RestApiQueryOperation")
     def test_get_query_operation__old_api_version(self, rest_query, bulk_query):
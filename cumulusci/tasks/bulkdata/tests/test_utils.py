@@ -1,16 +1,19 @@
 import os
 from unittest import mock
 
+import pytest
 import responses
 from sqlalchemy import Column, Integer, MetaData, Table, Unicode, create_engine
 from sqlalchemy.orm import create_session, mapper
 
+from cumulusci.core.exceptions import BulkDataException
 from cumulusci.tasks import bulkdata
 from cumulusci.tasks.bulkdata.mapping_parser import parse_from_yaml
 from cumulusci.tasks.bulkdata.utils import (
     create_table,
     generate_batches,
     sql_bulk_insert_from_records,
+    sql_bulk_insert_from_records_incremental,
 )
 from cumulusci.utils import temporary_dir
 
@@ -103,6 +106,31 @@ class TestSqlAlchemyMixin:
 
         assert session.query(model).count() == 10
 
+    def test_sql_bulk_insert_from_records_incremental__batch_size(self):
+        engine, metadata = create_db_memory()
+        fields = [
+            Column("id", Integer(), primary_key=True, autoincrement=True),
+            Column("sf_id", Unicode(24)),
+        ]
+        id_t = Table("TestTable", metadata, *fields)
+        id_t.create()
+        model = type("TestModel", (object,), {})
+        mapper(model, id_t)
+
+        session = create_session(bind=engine, autocommit=False)
+        connection = session.connection()
+
+        batches = sql_bulk_insert_from_records_incremental(
+            connection=connection,
+            table=id_t,
+            columns=("id", "sf_id"),
+            record_iterable=([f"{x}", f"00100000000000{x}"] for x in range(10)),
+            batch_size=4,
+        )
+
+        counts = [session.query(model).count() for _ in batches]
+        assert counts == [4, 8, 10]
+
 
 class TestCreateTable:
     def test_create_table_legacy_oid_mapping(self):
@@ -138,6 +166,25 @@ class TestCreateTable:
             assert isinstance(t.columns["last_name"].type, Unicode)
             assert isinstance(t.columns["email"].type, Unicode)
 
+    def test_create_table__existing_tables(self):
+        mapping_file = os.path.join(os.path.dirname(__file__), "mapping_v2.yml")
+        content = parse_from_yaml(mapping_file)
+        account_mapping = content["Insert Contacts"]
+
+        with temporary_dir() as d:
+            tmp_db_path = os.path.join(d, "temp.db")
+
+            engine, metadata = create_db_file(tmp_db_path)
+            with mock.patch("cumulusci.tasks.bulkdata.utils.inspect") as inspect:
+                t = create_table(account_mapping, metadata, existing_tables=set())
+            inspect.assert_not_called()
+            assert t.name == "contacts"
+
+            with pytest.raises(BulkDataException, match="contacts"):
+                create_table(
+                    account_mapping, MetaData(bind=engine), existing_tables={"contacts"}
+                )
+
 
 class TestBatching:
     def test_batching_no_remainder(self):
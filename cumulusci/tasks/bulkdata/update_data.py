@@ -1,5 +1,6 @@
 import csv
 import re
+import typing as T
 from contextlib import contextmanager
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -121,10 +122,12 @@ class UpdateData(BaseSalesforceApiTask):
             csv_out = self.generate_data(csvfile, Path(outdir))
 
             with csv_out.open() as csv_out_open:
-                enriched_data = csv.DictReader(csv_out_open)
-                oid_index = enriched_data.fieldnames.index("Oid")
-                enriched_data.fieldnames[oid_index] = "Id"
-                ds = self.load_data(qs.job_result.records_processed, enriched_data)
+                enriched_data = csv.reader(csv_out_open)
+                columns = next(enriched_data)
+                columns[columns.index("Oid")] = "Id"
+                ds = self.load_data(
+                    qs.job_result.records_processed, columns, enriched_data
+                )
             records = ds.job_result.records_processed
             errors = ds.job_result.total_row_errors
 
@@ -197,12 +200,13 @@ class UpdateData(BaseSalesforceApiTask):
             return None
         return qs
 
-    def load_data(self, row_count: int, records: csv.DictReader):
+    def load_data(
+        self, row_count: int, columns: T.List[str], records: T.Iterable[T.List[str]]
+    ):
         obj = self.sobject
         self.logger.info(f"Updating {row_count} {obj} records")
-        fieldnames = [
-            f for f in records.fieldnames if f != "id" and not f.startswith("_")
-        ]
+        fieldnames = [f for f in columns if f != "id" and not f.startswith("_")]
+        positions = [columns.index(fieldname) for fieldname in fieldnames]
 
         ds = get_dml_operation(
             sobject=obj,
@@ -215,7 +219,7 @@ class UpdateData(BaseSalesforceApiTask):
         )
 
         def cleanup(record):
-            return tuple(record[fieldname] for fieldname in fieldnames)
+            return tuple(record[position] for position in positions)
 
         ds.start()
         ds.load_records(cleanup(record) for record in records)
@@ -86,11 +86,15 @@ def _handle_primary_key(mapping, fields):
     fields.append(Column(id_column, Unicode(255), primary_key=True))
 
 
-def create_table(mapping, metadata) -> Table:
+def create_table(
+    mapping, metadata, existing_tables: T.Optional[T.Set[str]] = None
+) -> Table:
     """Given a mapping data structure (from mapping.yml) and SQLAlchemy
     metadata, create a table matching the mapping.
 
-    Mapping should be a MappingStep instance"""
+    Mapping should be a MappingStep instance. Callers creating many tables
+    can pass the set of table names already in the database to avoid
+    inspecting it once per table."""
 
     fields = []
     _handle_primary_key(mapping, fields)
@@ -104,13 +108,21 @@ def create_table(mapping, metadata) -> Table:
 
     if mapping.record_type:
         fields.append(Column("record_type", Unicode(255)))
-    return create_table_if_needed(mapping.table, metadata, fields)
+    return create_table_if_needed(mapping.table, metadata, fields, existing_tables)
 
 
-def create_table_if_needed(tablename, metadata, fields: T.List[Column]) -> Table:
+def create_table_if_needed(
+    tablename,
+    metadata,
+    fields: T.List[Column],
+    existing_tables: T.Optional[T.Set[str]] = None,
+) -> Table:
     t = Table(tablename, metadata, *fields)
-    inspector = inspect(metadata.bind)
-    if inspector.has_table(tablename):
+    if existing_tables is None:
+        exists = inspect(metadata.bind).has_table(tablename)
+    else:
+        exists = tablename in existing_tables
+    if exists:
         raise BulkDataException(f"Table already exists: {tablename}")
     t.create(metadata.bind)
     return t
@@ -161,12 +173,17 @@ def consume(iterator):
     collections.deque(iterator, maxlen=0)
 
 
+# Rows per executemany() call (and transaction) when persisting records.
+DEFAULT_SQL_INSERT_BATCH_SIZE = 10_000
+
+
 def sql_bulk_insert_from_records(
     *,
     connection: Connection,
     table: Table,
     columns: T.Tuple[str],
     record_iterable: T.Iterable,
+    batch_size: int = DEFAULT_SQL_INSERT_BATCH_SIZE,
 ) -> None:
     """Persist records from the given generator into the local database."""
     consume(
@@ -175,6 +192,7 @@ def sql_bulk_insert_from_records(
             table=table,
             columns=columns,
             record_iterable=record_iterable,
+            batch_size=batch_size,
         )
     )
 
@@ -185,14 +203,17 @@ def sql_bulk_insert_from_records_incremental(
     table: Table,
     columns: T.Tuple[str],
     record_iterable: T.Iterable,
+    batch_size: int = DEFAULT_SQL_INSERT_BATCH_SIZE,
 ):
     """Generator that persists batches of records from the given generator into the local database
 
     Yields after every batch."""
     dict_iterable = (dict(zip(columns, row)) for row in record_iterable)
-    for group in iterate_in_chunks(10000, dict_iterable):
+    # Executed with a list of parameter sets, giving the driver an executemany()
+    insert_statement = table.insert()
+    for group in iterate_in_chunks(batch_size, dict_iterable):
         with connection.begin():
-            connection.execute(table.insert(), group)
+            connection.execute(insert_statement, group)
         # self.session.flush()  -- Did this line do anything?
         yield
 
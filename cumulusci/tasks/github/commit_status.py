@@ -1,8 +1,14 @@
+from simple_salesforce import format_soql
+
 from cumulusci.core.exceptions import DependencyLookupError
 from cumulusci.core.github import get_version_id_from_commit
 from cumulusci.tasks.github.base import BaseGithubTask
 from cumulusci.tasks.salesforce.BaseSalesforceApiTask import BaseSalesforceApiTask
 
+DEPENDENCIES_QUERY = (
+    "SELECT Dependencies FROM SubscriberPackageVersion WHERE Id = {version_id}"
+)
+
 
 class GetPackageDataFromCommitStatus(BaseGithubTask, BaseSalesforceApiTask):
     task_options = {
@@ -41,9 +47,7 @@ class GetPackageDataFromCommitStatus(BaseGithubTask, BaseSalesforceApiTask):
         self.return_values = {"dependencies": dependencies, "version_id": version_id}
 
     def _get_dependencies(self, version_id):
-        res = self.tooling.query(
-            f"SELECT Dependencies FROM SubscriberPackageVersion WHERE Id='{version_id}'"
-        )
+        res = self.tooling.query(format_soql(DEPENDENCIES_QUERY, version_id=version_id))
         if res["records"]:
             subscriber_version = res["records"][0]
             dependencies = subscriber_version["Dependencies"] or {"ids": []}
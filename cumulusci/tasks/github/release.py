@@ -1,5 +1,6 @@
 import json
 import time
+import weakref
 from datetime import datetime
 
 import github3.exceptions
@@ -11,6 +12,13 @@ from cumulusci.core.exceptions import GithubException, TaskOptionsError
 from cumulusci.core.github import get_commit
 from cumulusci.tasks.github.base import BaseGithubTask
 
+# Seconds to wait between checks for a newly created tag.
+TAG_POLL_DELAYS = (0.1, 0.2, 0.4, 0.8, 1.6)
+
+# Static dependencies resolved for each project config, keyed on the parsed
+# dependencies and the resolution strategy. Entries go away with the config.
+_static_dependencies_cache = weakref.WeakKeyDictionary()
+
 
 class CreateRelease(BaseGithubTask):
 
@@ -75,16 +83,15 @@ class CreateRelease(BaseGithubTask):
             message += f"\n\nversion_id: {self.options['version_id']}"
         if self.options.get("package_type"):
             message += f"\n\npackage_type: {self.options['package_type']}"
-        dependencies = get_static_dependencies(
-            self.project_config,
-            dependencies=parse_dependencies(
+        dependencies = [
+            d.dict(exclude_none=True)
+            for d in self._get_static_dependencies(
                 self.options.get("dependencies")
                 or self.project_config.project__dependencies,
-            ),
-            resolution_strategy=self.options.get("resolution_strategy") or "production",
-        )
+                self.options.get("resolution_strategy") or "production",
+            )
+        ]
         if dependencies:
-            dependencies = [d.dict(exclude_none=True) for d in dependencies]
             message += "\n\ndependencies: {}".format(json.dumps(dependencies, indent=4))
 
         try:
@@ -104,8 +111,7 @@ class CreateRelease(BaseGithubTask):
                 lightweight=False,
             )
 
-            # Sleep for Github to catch up with the fact that the tag actually exists!
-            time.sleep(3)
+            self._wait_for_tag(repo, tag_name)
 
         prerelease = tag_name.startswith(self.project_config.project__git__prefix_beta)
 
@@ -117,7 +123,16 @@ class CreateRelease(BaseGithubTask):
         }
         if "release_content" in self.options:
             release_parameters["body"] = self.options["release_content"]
-        release = repo.create_release(**release_parameters)
+        try:
+            release = repo.create_release(**release_parameters)
+        except github3.exceptions.UnprocessableEntity as e:
+            # Another run may have created the release since it was verified
+            if any(
+                isinstance(error, dict) and error.get("code") == "already_exists"
+                for error in e.errors
+            ):
+                self._raise_release_exists(repo, tag_name)
+            raise
         self.return_values = {
             "tag_name": tag_name,
             "name": version,
@@ -125,6 +140,21 @@ class CreateRelease(BaseGithubTask):
         }
         self.logger.info(f"Created release {release.name} at {release.html_url}")
 
+    def _get_static_dependencies(self, dependencies, resolution_strategy):
+        """Resolve the dependencies to static dependencies. Cached per project
+        config so that releases created from it, such as a beta and then a
+        production release, only resolve dynamic dependencies once."""
+        dependencies = tuple(parse_dependencies(dependencies))
+        cache = _static_dependencies_cache.setdefault(self.project_config, {})
+        key = (dependencies, resolution_strategy)
+        if key not in cache:
+            cache[key] = get_static_dependencies(
+                self.project_config,
+                dependencies=list(dependencies),
+                resolution_strategy=resolution_strategy,
+            )
+        return cache[key]
+
     def _verify_release(self, repo: Repository, tag_name: str) -> None:
         """Make sure release doesn't already exist"""
         try:
@@ -136,6 +166,32 @@ class CreateRelease(BaseGithubTask):
             self.logger.error(message)
             raise GithubException(message)
 
+    def _raise_release_exists(self, repo: Repository, tag_name: str) -> None:
+        """Report the release which Github says already exists for the tag."""
+        try:
+            release = repo.release_from_tag(tag_name)
+        except github3.exceptions.NotFoundError:
+            # Draft releases can't be looked up by tag
+            message = f"Release for tag {tag_name} already exists"
+        else:
+            message = f"Release {release.name} already exists at {release.html_url}"
+        self.logger.error(message)
+        raise GithubException(message)
+
+    def _wait_for_tag(self, repo: Repository, tag_name: str) -> None:
+        """Wait for Github to catch up with the fact that the tag actually exists!
+
+        Usually the tag is visible right away; if it still isn't after a few
+        seconds, go ahead and let creating the release report any problem."""
+        # Check once more after the last delay, without sleeping after it
+        for delay in (*TAG_POLL_DELAYS, None):
+            try:
+                repo.ref(f"tags/{tag_name}")
+                return
+            except github3.exceptions.NotFoundError:
+                if delay is not None:
+                    time.sleep(delay)
+
     def _verify_commit(self, repo: Repository) -> None:
         """Verify that the commit exists on the remote."""
         get_commit(repo, self.commit)
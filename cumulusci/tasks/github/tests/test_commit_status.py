@@ -194,3 +194,36 @@ class TestGetPackageDataFromCommitStatus(GithubApiTestMixin):
             DependencyLookupError, match="Could not look up dependencies of 04t"
         ):
             task._get_dependencies("04t")
+
+    @responses.activate
+    def test_get_dependencies__escapes_version_id(self):
+        responses.add(
+            "GET",
+            f"https://salesforce/services/data/v{CURRENT_SF_API_VERSION}/tooling/query/",
+            json={"records": [{"Dependencies": None}]},
+        )
+
+        project_config = create_project_config(repo_commit="abcdef")
+        project_config.keychain.set_service(
+            "github",
+            "test_alias",
+            ServiceConfig(
+                {
+                    "username": "TestUser",
+                    "token": "TestPass",
+                    "email": "testuser@testdomain.com",
+                }
+            ),
+        )
+        task_config = TaskConfig({"options": {"context": "2gp"}})
+        org_config = OrgConfig(
+            {"instance_url": "https://salesforce", "access_token": "TOKEN"}, "test"
+        )
+        task = GetPackageDataFromCommitStatus(project_config, task_config, org_config)
+        task._init_task()
+
+        assert task._get_dependencies("04t' OR Id != '") == []
+        assert (
+            "Id+%3D+%2704t%5C%27+OR+Id+%21%3D+%5C%27%27"
+            in responses.calls[0].request.url
+        )
@@ -1,12 +1,14 @@
 import json
 from unittest import mock
 
+import github3.exceptions
 import pytest
 import responses
 
 from cumulusci.core.config import ServiceConfig, TaskConfig
 from cumulusci.core.exceptions import GithubException, TaskOptionsError
 from cumulusci.tasks.github import CreateRelease
+from cumulusci.tasks.github.release import TAG_POLL_DELAYS
 from cumulusci.tasks.github.tests.util_github_api import GithubApiTestMixin
 from cumulusci.tests.util import create_project_config
 
@@ -55,6 +57,11 @@ class TestCreateRelease(GithubApiTestMixin):
             url=self.repo_api_url + "/git/ref/tags/release/1.0",
             status=404,
         )
+        responses.add(
+            method=responses.GET,
+            url=self.repo_api_url + "/git/ref/tags/release/1.0",
+            json=self._get_expected_ref("tags/release/1.0", DUMMY_SHA),
+        )
         responses.add(
             method=responses.GET,
             url=self.repo_api_url + f"/commits/{DUMMY_SHA}",
@@ -111,6 +118,60 @@ class TestCreateRelease(GithubApiTestMixin):
         assert not release_request["prerelease"]
         assert release_request["body"] == "foo release"
 
+    def test_wait_for_tag(self):
+        task = CreateRelease(
+            self.project_config,
+            TaskConfig(
+                {
+                    "options": {
+                        "version": "1.0",
+                        "package_type": "1GP",
+                        "tag_prefix": "release/",
+                    }
+                }
+            ),
+        )
+        not_found = github3.exceptions.NotFoundError(mock.Mock(status_code=404))
+        repo = mock.Mock()
+        repo.ref.side_effect = [not_found, not_found, mock.Mock()]
+        with mock.patch("cumulusci.tasks.github.release.time.sleep") as sleep:
+            task._wait_for_tag(repo, "release/1.0")
+
+        assert repo.ref.call_count == 3
+        assert sleep.call_args_list == [mock.call(0.1), mock.call(0.2)]
+
+        # Give up quietly once the delays run out, without a final sleep.
+        repo.reset_mock()
+        repo.ref.side_effect = not_found
+        with mock.patch("cumulusci.tasks.github.release.time.sleep") as sleep:
+            task._wait_for_tag(repo, "release/1.0")
+        assert repo.ref.call_count == len(TAG_POLL_DELAYS) + 1
+        assert sleep.call_args_list == [mock.call(delay) for delay in TAG_POLL_DELAYS]
+
+    def test_get_static_dependencies__cached(self):
+        dependencies = [{"namespace": "foo", "version": "1.0"}]
+        with mock.patch(
+            "cumulusci.tasks.github.release.get_static_dependencies",
+            return_value=[],
+        ) as get_static_dependencies:
+            for _ in range(2):
+                task = CreateRelease(
+                    self.project_config,
+                    TaskConfig(
+                        {
+                            "options": {
+                                "version": "1.0",
+                                "package_type": "1GP",
+                                "tag_prefix": "release/",
+                            }
+                        }
+                    ),
+                )
+                task._get_static_dependencies(dependencies, "production")
+            task._get_static_dependencies(dependencies, "include_beta")
+
+        assert get_static_dependencies.call_count == 2
+
     @responses.activate
     def test_run_task__release_already_exists(self):
         responses.add(
@@ -137,11 +198,13 @@ class TestCreateRelease(GithubApiTestMixin):
                 }
             ),
         )
-        with pytest.raises(GithubException):
+        with pytest.raises(GithubException, match="already exists"):
             task()
+        # Nothing was written before the existing release was found
+        assert [call.request.method for call in responses.calls] == ["GET", "GET"]
 
     @responses.activate
-    def test_run_task__no_commit(self):
+    def test_run_task__unprocessable_string_errors(self):
         responses.add(
             method=responses.GET,
             url=self.repo_api_url,
@@ -152,6 +215,105 @@ class TestCreateRelease(GithubApiTestMixin):
             url=self.repo_api_url + "/releases/tags/release/1.0",
             status=404,
         )
+        responses.add(
+            method=responses.GET,
+            url=self.repo_api_url + f"/commits/{DUMMY_SHA}",
+            json=self._get_expected_commit(DUMMY_SHA),
+        )
+        responses.add(
+            method=responses.GET,
+            url=self.repo_api_url + "/git/ref/tags/release/1.0",
+            json=self._get_expected_ref("tags/release/1.0", DUMMY_SHA),
+        )
+        responses.add(
+            method=responses.POST,
+            url=self.repo_api_url + "/releases",
+            json={
+                "message": "Validation Failed",
+                "errors": ["Published releases must have a valid tag"],
+            },
+            status=422,
+        )
+
+        task = CreateRelease(
+            self.project_config,
+            TaskConfig(
+                {
+                    "options": {
+                        "version": "1.0",
+                        "version_id": "04t000000000000",
+                        "package_type": "1GP",
+                        "tag_prefix": "release/",
+                    }
+                }
+            ),
+        )
+        with pytest.raises(github3.exceptions.UnprocessableEntity):
+            task()
+
+    @responses.activate
+    def test_run_task__release_already_exists__not_found(self):
+        responses.add(
+            method=responses.GET,
+            url=self.repo_api_url,
+            json=self._get_expected_repo(owner=self.repo_owner, name=self.repo_name),
+        )
+        responses.add(
+            method=responses.GET,
+            url=self.repo_api_url + f"/commits/{DUMMY_SHA}",
+            json=self._get_expected_commit(DUMMY_SHA),
+        )
+        responses.add(
+            method=responses.GET,
+            url=self.repo_api_url + "/git/ref/tags/release/1.0",
+            json=self._get_expected_ref("tags/release/1.0", DUMMY_SHA),
+        )
+        responses.add(
+            method=responses.POST,
+            url=self.repo_api_url + "/releases",
+            json={
+                "message": "Validation Failed",
+                "errors": [
+                    {
+                        "resource": "Release",
+                        "code": "already_exists",
+                        "field": "tag_name",
+                    }
+                ],
+            },
+            status=422,
+        )
+        responses.add(
+            method=responses.GET,
+            url=self.repo_api_url + "/releases/tags/release/1.0",
+            status=404,
+        )
+
+        task = CreateRelease(
+            self.project_config,
+            TaskConfig(
+                {
+                    "options": {
+                        "version": "1.0",
+                        "version_id": "04t000000000000",
+                        "package_type": "1GP",
+                        "tag_prefix": "release/",
+                    }
+                }
+            ),
+        )
+        with pytest.raises(
+            GithubException, match="Release for tag release/1.0 already exists"
+        ):
+            task()
+
+    @responses.activate
+    def test_run_task__no_commit(self):
+        responses.add(
+            method=responses.GET,
+            url=self.repo_api_url,
+            json=self._get_expected_repo(owner=self.repo_owner, name=self.repo_name),
+        )
         del self.project_config._repo_info["commit"]
 
         with pytest.raises(GithubException):
@@ -167,11 +329,6 @@ class TestCreateRelease(GithubApiTestMixin):
             url=self.repo_api_url,
             json=self._get_expected_repo(owner=self.repo_owner, name=self.repo_name),
         )
-        responses.add(
-            method=responses.GET,
-            url=self.repo_api_url + "/releases/tags/release/1.0",
-            status=404,
-        )
         self.project_config._repo_info["commit"] = "too_short"
 
         with pytest.raises(TaskOptionsError):
@@ -196,6 +353,11 @@ class TestCreateRelease(GithubApiTestMixin):
             url=self.repo_api_url + "/git/ref/tags/custom/1.0",
             status=404,
         )
+        responses.add(
+            method=responses.GET,
+            url=self.repo_api_url + "/git/ref/tags/custom/1.0",
+            json=self._get_expected_ref("tags/custom/1.0", DUMMY_SHA),
+        )
         responses.add(
             method=responses.GET,
             url=self.repo_api_url + f"/commits/{DUMMY_SHA}",
@@ -262,6 +424,11 @@ class TestCreateRelease(GithubApiTestMixin):
             url=self.repo_api_url + "/git/ref/tags/beta/1.0-Beta_1",
             status=404,
         )
+        responses.add(
+            method=responses.GET,
+            url=self.repo_api_url + "/git/ref/tags/beta/1.0-Beta_1",
+            json=self._get_expected_ref("tags/beta/1.0-Beta_1", DUMMY_SHA),
+        )
         responses.add(
             method=responses.GET,
             url=self.repo_api_url + f"/commits/{DUMMY_SHA}",
@@ -329,6 +496,11 @@ class TestCreateRelease(GithubApiTestMixin):
             url=self.repo_api_url + "/git/ref/tags/beta/1.1",
             status=404,
         )
+        responses.add(
+            method=responses.GET,
+            url=self.repo_api_url + "/git/ref/tags/beta/1.1",
+            json=self._get_expected_ref("tags/beta/1.1", DUMMY_SHA),
+        )
         responses.add(
             method=responses.GET,
             url=self.repo_api_url + f"/commits/{DUMMY_SHA}",
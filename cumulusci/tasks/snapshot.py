@@ -1,20 +1,32 @@
 import json
 import os
+import re
 import time
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Optional
+
 from dateutil.parser import parse
-from cumulusci.core.exceptions import CumulusCIException, SalesforceException
-from cumulusci.core.sfdx import sfdx
-from cumulusci.core.utils import process_bool_arg
-from cumulusci.salesforce_api.utils import get_simple_salesforce_connection
-from cumulusci.tasks.salesforce import BaseSalesforceTask
-from cumulusci.tasks.github.base import BaseGithubTask
 from github3 import GitHubError
 from pydantic import BaseModel, Field, validator
-from simple_salesforce import Salesforce
-from simple_salesforce.exceptions import SalesforceResourceNotFound
 from rich.console import Console
+from rich.panel import Panel
+from rich.progress import (
+    BarColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    TimeElapsedColumn,
+)
 from rich.table import Table
+from simple_salesforce.exceptions import SalesforceResourceNotFound
+
+from cumulusci.core.exceptions import CumulusCIException, SalesforceException
+from cumulusci.core.sfdx import sfdx
+from cumulusci.core.utils import process_bool_arg, process_list_arg
+from cumulusci.salesforce_api.utils import get_simple_salesforce_connection
+from cumulusci.tasks.github.base import BaseGithubTask
+from cumulusci.tasks.salesforce import BaseSalesforceTask
 
 ORG_SNAPSHOT_FIELDS = [
     "Id",
@@ -27,41 +39,61 @@ ORG_SNAPSHOT_FIELDS = [
     "ExpirationDate",
     "Error",
 ]
+ORG_SNAPSHOT_DATETIME_FIELDS = frozenset(("CreatedDate", "LastModifiedDate"))
 
-
-import time
-from rich.console import Console
-from rich.progress import (
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    BarColumn,
-    TimeElapsedColumn,
+PR_SNAPSHOT_REPORT_FIELDS = (
+    "Id",
+    "SnapshotName",
+    "Status",
+    "Description",
+    "CreatedDate",
+    "ExpirationDate",
 )
-from rich.panel import Panel
-from rich.live import Live
+PR_SNAPSHOT_DATETIME_FIELDS = frozenset(("CreatedDate", "ExpirationDate"))
+
+SNAPSHOT_NAME_RE = re.compile(r"[A-Za-z0-9]+")
+
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+DATE_FORMAT = "%Y-%m-%d"
+
+
+def _format_datetime_string(
+    date_string: Optional[str], fmt: str = DATETIME_FORMAT
+) -> str:
+    """Format a Salesforce date or datetime string for display, or N/A if unset.
+
+    Salesforce returns ISO 8601 values, which datetime.fromisoformat reads
+    much faster than dateutil; dateutil remains the fallback for offsets like
+    +0000 that older Pythons don't accept."""
+    if date_string is None:
+        return "N/A"
+    try:
+        dt = datetime.fromisoformat(date_string.replace("Z", "+00:00"))
+    except ValueError:
+        dt = parse(date_string)
+    return dt.strftime(fmt)
 
 
 class SnapshotNameValidator(BaseModel):
     base_name: str = Field(..., max_length=13)
 
-    @classmethod
     @validator("base_name")
     def validate_name(cls, name):
-        if len(name) > 13:
-            raise ValueError("Snapshot name cannot exceed 13 characters")
-        if not name.isalnum():
+        if not SNAPSHOT_NAME_RE.fullmatch(name):
             raise ValueError("Snapshot name must only contain alphanumeric characters")
         return name
 
 
 class SnapshotManager:
-    def __init__(self, devhub, logger):
+    def __init__(self, devhub, logger, console=None):
         self.devhub = devhub
         self.logger = logger
         self.existing_active_snapshot_id = None
+        self.existing_active_snapshot_description = None
         self.temporary_snapshot_name = None
-        self.console = Console()
+        self.console = console or Console()
+        self._active_snapshot_cache = {}
 
     def generate_temp_name(self, base_name: str, max_length: int = 14) -> str:
         temp_name = f"{base_name}0"
@@ -71,19 +103,33 @@ class SnapshotManager:
         return temp_name
 
     def query_existing_active_snapshot(self, snapshot_name: str):
+        if snapshot_name in self._active_snapshot_cache:
+            self._set_existing_active_snapshot(
+                self._active_snapshot_cache[snapshot_name]
+            )
+            return
+
         self.logger.info(
             f"Checking for existing active snapshot with name: {snapshot_name}"
         )
-        query = f"SELECT Id FROM OrgSnapshot WHERE Status = 'Active' AND SnapshotName = '{snapshot_name}'"
+        query = f"SELECT Id, Description FROM OrgSnapshot WHERE Status = 'Active' AND SnapshotName = '{snapshot_name}'"
         result = self.devhub.query(query)
 
-        if result["totalSize"] > 0:
-            self.existing_active_snapshot_id = result["records"][0]["Id"]
+        snapshot = result["records"][0] if result["totalSize"] > 0 else None
+        self._set_existing_active_snapshot(snapshot)
+        if snapshot:
             self.logger.info(
                 f"Found existing active snapshot: {self.existing_active_snapshot_id}"
             )
         else:
             self.logger.info(f"No active snapshot found with name {snapshot_name}")
+        self._active_snapshot_cache[snapshot_name] = snapshot
+
+    def _set_existing_active_snapshot(self, snapshot):
+        self.existing_active_snapshot_id = snapshot["Id"] if snapshot else None
+        self.existing_active_snapshot_description = (
+            snapshot.get("Description") if snapshot else None
+        )
 
     def query_and_delete_in_progress_snapshot(self, snapshot_name: str):
         self.logger.info(
@@ -97,6 +143,7 @@ class SnapshotManager:
             self.logger.info(
                 f"Found in-progress snapshot {snapshot_id}, deleting it..."
             )
+            self._active_snapshot_cache.clear()
             self.devhub.OrgSnapshot.delete(snapshot_id)
             self.logger.info(f"Deleted in-progress snapshot: {snapshot_id}")
         else:
@@ -106,6 +153,7 @@ class SnapshotManager:
         self, snapshot_name: str, description: str, source_org: str
     ):
         self.logger.info(f"Creating new org snapshot: {snapshot_name}")
+        self._active_snapshot_cache.clear()
         snapshot_body = {
             "Description": description,
             "SnapshotName": snapshot_name,
@@ -172,11 +220,13 @@ class SnapshotManager:
         snapshot_id = snapshot_id or self.existing_active_snapshot_id
         if snapshot_id:
             self.logger.info(f"Deleting snapshot: {snapshot_id}")
+            self._active_snapshot_cache.clear()
             self.devhub.OrgSnapshot.delete(snapshot_id)
             self.logger.info(f"Deleted snapshot: {snapshot_id}")
 
     def rename_snapshot(self, snapshot_id: str, new_name: str):
         self.logger.info(f"Renaming snapshot {snapshot_id} to {new_name}")
+        self._active_snapshot_cache.clear()
         update_body = {"SnapshotName": new_name}
         self.devhub.OrgSnapshot.update(snapshot_id, update_body)
         self.logger.info(f"Snapshot {snapshot_id} renamed to {new_name}")
@@ -205,6 +255,20 @@ class SnapshotManager:
                 task, advance=5, description="[green]Checking for existing snapshots"
             )
             self.query_existing_active_snapshot(base_name)
+            if (
+                self.existing_active_snapshot_id
+                and self.existing_active_snapshot_description == description
+            ):
+                # The active snapshot was already built from the same inputs
+                progress.update(task, completed=100)
+                self.console.print(
+                    Panel(
+                        f"Snapshot {self.existing_active_snapshot_id} already matches the description, skipping creation.",
+                        title="Snapshot Creation",
+                        border_style="green",
+                    )
+                )
+                return self.devhub.OrgSnapshot.get(self.existing_active_snapshot_id)
             self.query_and_delete_in_progress_snapshot(temp_name)
 
             # Step 3: Create new snapshot (10% progress)
@@ -263,6 +327,9 @@ class SnapshotManager:
 
             # Step 3: Finalize snapshot (30% progress)
             progress.update(task, advance=30, description="[green]Finalizing snapshot")
+            if snapshot_id == self.existing_active_snapshot_id:
+                # The first step reused the active snapshot; nothing to swap
+                return snapshot
             self.delete_snapshot()
             self.rename_snapshot(snapshot_id, snapshot_name)
             return snapshot
@@ -576,20 +643,23 @@ class CreateScratchOrgSnapshot(BaseSalesforceTask):
         # Output to GitHub Actions Job Summary
         summary_file = os.getenv("GITHUB_STEP_SUMMARY")
         if summary_file:
+            lines = [
+                "## Snapshot Creation Summary\n",
+                f"- **Duration**: {duration_str}\n",
+                f"- **Snapshot ID**: {self.snapshot_id}\n",
+                f"- **Fields**: {', '.join(ORG_SNAPSHOT_FIELDS)}\n",
+                "\n### Snapshot Details\n",
+            ]
+            for field in ORG_SNAPSHOT_FIELDS:
+                if field in snapshot:
+                    value = snapshot[field]
+                    if field in ORG_SNAPSHOT_DATETIME_FIELDS:
+                        value = self._format_datetime(value)
+                    elif field == "ExpirationDate":
+                        value = self._format_date(value)
+                    lines.append(f"- **{field}**: {value}\n")
             with open(summary_file, "a") as f:
-                f.write(f"## Snapshot Creation Summary\n")
-                f.write(f"- **Duration**: {duration_str}\n")
-                f.write(f"- **Snapshot ID**: {self.snapshot_id}\n")
-                f.write(f"- **Fields**: {', '.join(ORG_SNAPSHOT_FIELDS)}\n")
-                f.write("\n### Snapshot Details\n")
-                for field in ORG_SNAPSHOT_FIELDS:
-                    if field in snapshot:
-                        value = snapshot[field]
-                        if field in ["CreatedDate", "LastModifiedDate"]:
-                            value = self._format_datetime(value)
-                        elif field == "ExpirationDate":
-                            value = self._format_date(value)
-                        f.write(f"- **{field}**: {value}\n")
+                f.write("".join(lines))
 
     def _print_snapshot_details(self, snapshot):
         table = Table(title="Snapshot Details")
@@ -599,7 +669,7 @@ class CreateScratchOrgSnapshot(BaseSalesforceTask):
         for field in ORG_SNAPSHOT_FIELDS:
             if field in snapshot:
                 value = snapshot[field]
-                if field in ["CreatedDate", "LastModifiedDate"]:
+                if field in ORG_SNAPSHOT_DATETIME_FIELDS:
                     value = self._format_datetime(value)
                 elif field == "ExpirationDate":
                     value = self._format_date(value)
@@ -608,15 +678,10 @@ class CreateScratchOrgSnapshot(BaseSalesforceTask):
         self.console.print(table)
 
     def _format_datetime(self, date_string):
-        if date_string is None:
-            return "N/A"
-        dt = parse(date_string)
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
+        return _format_datetime_string(date_string)
 
     def _format_date(self, date_string):
-        if date_string is None:
-            return "N/A"
-        return datetime.strptime(date_string, "%Y-%m-%d").strftime("%Y-%m-%d")
+        return _format_datetime_string(date_string, DATE_FORMAT)
 
 
 class GithubPullRequestSnapshot(BaseGithubTask, BaseDevhubTask):
@@ -657,7 +722,7 @@ class GithubPullRequestSnapshot(BaseGithubTask, BaseDevhubTask):
             "required": False,
         },
         "snapshot_pr_label": {
-            "description": "Limit snapshot creation to only PRs with this label",
+            "description": "Limit snapshot creation to only PRs with this label, or one of these comma-separated labels",
             "required": False,
         },
         "snapshot_pr_draft": {
@@ -669,7 +734,7 @@ class GithubPullRequestSnapshot(BaseGithubTask, BaseDevhubTask):
             "required": False,
         },
         "snapshot_fail_pr_label": {
-            "description": "Limit failure snapshot creation to only PRs with this label",
+            "description": "Limit failure snapshot creation to only PRs with this label, or one of these comma-separated labels",
             "required": False,
         },
         "snapshot_fail_pr_draft": {
@@ -688,41 +753,35 @@ class GithubPullRequestSnapshot(BaseGithubTask, BaseDevhubTask):
     api_version = "60.0"
     salesforce_task = True
 
+    # Boolean options and the defaults used when they are not set
+    bool_options = (
+        ("build_success", True),
+        ("build_fail_tests", None),
+        ("wait", True),
+        ("snapshot_is_packaged", None),
+        ("snapshot_pr", True),
+        ("snapshot_pr_draft", False),
+        ("snapshot_fail_pr", True),
+        ("snapshot_fail_pr_draft", False),
+        ("snapshot_fail_test_only", False),
+    )
+
     def _init_options(self, kwargs):
         super()._init_options(kwargs)
-        self.options["build_success"] = process_bool_arg(
-            self.options.get("build_success", True)
-        )
-        self.options["build_fail_tests"] = process_bool_arg(
-            self.options.get("build_fail_tests")
-        )
+        for name, default in self.bool_options:
+            self.options[name] = process_bool_arg(self.options.get(name, default))
         self.options["commit_status_context"] = self.options.get(
             "commit_status_context"
         )
-        self.options["wait"] = process_bool_arg(self.options.get("wait", True))
         self.options["snapshot_id"] = self.options.get("snapshot_id")
-        self.options["snapshot_is_packaged"] = process_bool_arg(
-            self.options.get("snapshot_is_packaged")
-        )
-        self.options["snapshot_pr"] = process_bool_arg(
-            self.options.get("snapshot_pr", True)
-        )
-        self.options["snapshot_pr_draft"] = process_bool_arg(
-            self.options.get("snapshot_pr_draft", False)
-        )
-        self.options["snapshot_fail_pr"] = process_bool_arg(
-            self.options.get("snapshot_fail_pr", True)
-        )
-        self.options["snapshot_fail_pr_draft"] = process_bool_arg(
-            self.options.get("snapshot_fail_pr_draft", False)
-        )
-        self.options["snapshot_fail_test_only"] = process_bool_arg(
-            self.options.get("snapshot_fail_test_only", False)
-        )
         self.options["snapshot_pr_label"] = self.options.get("snapshot_pr_label")
         self.options["snapshot_fail_pr_label"] = self.options.get(
             "snapshot_fail_pr_label"
         )
+        self._pr_labels = self._parse_labels(self.options["snapshot_pr_label"])
+        self._fail_pr_labels = self._parse_labels(
+            self.options["snapshot_fail_pr_label"]
+        )
         self.options["base_branch"] = self.options.get(
             "base_branch", self.project_config.project__git__default_branch
         )
@@ -732,18 +791,25 @@ class GithubPullRequestSnapshot(BaseGithubTask, BaseDevhubTask):
 
         self.console = Console()
 
+    @staticmethod
+    def _parse_labels(labels):
+        """Parse a label option, which may list several labels, into a set."""
+        return frozenset(label for label in process_list_arg(labels) or [] if label)
+
     def _init_task(self):
         super()._init_task()
         self.repo = self.get_repo()
 
     def _run_task(self):
-        pr = self._get_pull_request()
+        pr = self._get_pull_request() if self._needs_pr_lookup() else None
 
         if self._should_create_snapshot(pr):
             snapshot_name = self._generate_snapshot_name(pr)
             description = self._generate_snapshot_description(pr)
 
-            snapshot_manager = SnapshotManager(self.devhub, self.logger)
+            snapshot_manager = SnapshotManager(
+                self.devhub, self.logger, console=self.console
+            )
             try:
                 if self.options["snapshot_id"]:
                     snapshot = snapshot_manager.finalize_temp_snapshot(
@@ -777,23 +843,35 @@ class GithubPullRequestSnapshot(BaseGithubTask, BaseDevhubTask):
 
             self._report_result(snapshot)
             if self.options["wait"] is False:
-                if os.getenv("GITHUB_OUTPUT"):
-                    with open(os.getenv("GITHUB_OUTPUT"), "w") as f:
+                output_file = os.getenv("GITHUB_OUTPUT")
+                if output_file:
+                    with open(output_file, "w") as f:
                         f.write(f"SNAPSHOT_ID={snapshot['Id']}")
                         return True
 
-            if self.options["commit_status_context"]:
-                active = self.return_values["snapshot_status"] == "Active"
-                self._create_commit_status(
-                    snapshot_name=(
-                        snapshot_name
-                        if active
-                        else f"{snapshot_name} ({self.return_values['snapshot_status']})"
-                    ),
-                    state="success" if active else "error",
-                )
-            if self.options["github_environment_prefix"]:
-                self._create_github_environment(snapshot_name)
+            # The commit status and the environment are independent GitHub
+            # requests, so send them concurrently.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = []
+                if self.options["commit_status_context"]:
+                    active = self.return_values["snapshot_status"] == "Active"
+                    futures.append(
+                        executor.submit(
+                            self._create_commit_status,
+                            snapshot_name=(
+                                snapshot_name
+                                if active
+                                else f"{snapshot_name} ({self.return_values['snapshot_status']})"
+                            ),
+                            state="success" if active else "error",
+                        )
+                    )
+                if self.options["github_environment_prefix"]:
+                    futures.append(
+                        executor.submit(self._create_github_environment, snapshot_name)
+                    )
+                for future in futures:
+                    future.result()
 
         else:
             if self.options.get("snapshot_id"):
@@ -810,58 +888,76 @@ class GithubPullRequestSnapshot(BaseGithubTask, BaseDevhubTask):
             )
 
     def _get_pull_request(self):
-        res = self.repo.pull_requests()
+        # Let GitHub filter the listing to open PRs into the base branch. The
+        # head branch is matched below rather than with a head=owner:branch
+        # filter, which would miss PRs opened from forks.
+        branch = self.project_config.repo_branch
+        base_branch = self.options["base_branch"]
+        res = self.repo.pull_requests(state="open", base=base_branch)
+        # For some reason, github3.py or the GitHub API can return non-matching
+        # PRs, so check each one and stop paging at the first match.
         for pr in res:
-            # For some reason, github3.py or the GitHub API is returning non-matching PRs
-            # This is a workaround to ensure we get the correct PR
-            self.logger.info(
-                f"Checking PR: {pr.number} [{pr.state}] {pr.head.ref} -> {pr.base.ref}"
+            self.logger.debug(
+                "Checking PR: %s [%s] %s -> %s",
+                pr.number,
+                pr.state,
+                pr.head.ref,
+                pr.base.ref,
             )
             if (
                 pr.state == "open"
-                and pr.head.ref == self.project_config.repo_branch
-                and pr.base.ref == self.options["base_branch"]
+                and pr.head.ref == branch
+                and pr.base.ref == base_branch
             ):
+                self.logger.info(f"Found PR #{pr.number} for branch {branch}")
                 return pr
 
+    def _needs_pr_lookup(self):
+        """Whether the pull request can affect the snapshot decision.
+
+        Successful builds are skipped outright when snapshot_pr is False, so
+        there's no reason to ask GitHub for the pull request."""
+        return not (self.options["build_success"] and not self.options["snapshot_pr"])
+
     def _should_create_snapshot(self, pr):
         is_pr = pr is not None
         self.return_values["has_pr"] = is_pr
+        # has_pr stays False when the lookup is skipped; flag that case separately
+        self.return_values["pr_lookup_skipped"] = not self._needs_pr_lookup()
         is_draft = pr.draft if is_pr else False
         self.return_values["pr_is_draft"] = is_draft
-        pr_labels = [label["name"] for label in pr.labels] if is_pr else []
-        has_snapshot_label = self.options["snapshot_pr_label"] in pr_labels
-        has_snapshot_fail_label = self.options["snapshot_fail_pr_label"] in pr_labels
+        pr_labels = (
+            frozenset(label["name"] for label in pr.labels) if is_pr else frozenset()
+        )
+        has_snapshot_label = not pr_labels.isdisjoint(self._pr_labels)
+        has_snapshot_fail_label = not pr_labels.isdisjoint(self._fail_pr_labels)
         self.return_values["pr_has_snapshot_label"] = has_snapshot_label
         self.return_values["pr_has_snapshot_fail_label"] = has_snapshot_fail_label
 
         if self.options["build_success"] is True:
-            if not self.options["snapshot_pr"]:
-                self.return_values["skip_reason"] = "snapshot_pr is False"
-                return False
-            elif not is_pr:
-                self.return_values["skip_reason"] = "No pull request on the branch"
-                return False
-            elif self.options["snapshot_pr_label"] and not has_snapshot_label:
-                self.return_values["skip_reason"] = (
-                    "Pull request does not have snapshot label"
-                )
-                return False
-            elif is_draft and not self.options["snapshot_pr_draft"]:
-                self.return_values["skip_reason"] = (
-                    "Pull request is draft and snapshot_pr_draft is False"
-                )
-                return False
+            skip_reasons = (
+                (not self.options["snapshot_pr"], "snapshot_pr is False"),
+                (not is_pr, "No pull request on the branch"),
+                (
+                    self._pr_labels and not has_snapshot_label,
+                    "Pull request does not have snapshot label",
+                ),
+                (
+                    is_draft and not self.options["snapshot_pr_draft"],
+                    "Pull request is draft and snapshot_pr_draft is False",
+                ),
+            )
+            for skip, reason in skip_reasons:
+                if skip:
+                    self.return_values["skip_reason"] = reason
+                    return False
             return True
         else:
             if is_pr:
                 return (
                     self.options["snapshot_fail_pr"]
                     and (not is_draft or self.options["snapshot_fail_pr_draft"])
-                    and (
-                        not self.options["snapshot_fail_pr_label"]
-                        or has_snapshot_fail_label
-                    )
+                    and (not self._fail_pr_labels or has_snapshot_fail_label)
                     and (
                         not self.options["snapshot_fail_test_only"]
                         or not self.options["build_fail_tests"]
@@ -885,6 +981,9 @@ class GithubPullRequestSnapshot(BaseGithubTask, BaseDevhubTask):
     def _generate_snapshot_description(self, pr):
         if self.options["build_success"] is True:
             return f"Snapshot for PR #{pr.number}: {pr.title} of branch {self.project_config.repo_branch} for commit {self.project_config.repo_commit}"
+        elif pr is None:
+            # Failed builds are snapshotted even without a pull request
+            return f"Snapshot for failed build of branch {self.project_config.repo_branch} for commit {self.project_config.repo_commit}"
         else:
             return f"Snapshot for failed build on PR #{pr.number}: {pr.title} of branch {self.project_config.repo_branch} for commit {self.project_config.repo_commit}"
 
@@ -893,16 +992,9 @@ class GithubPullRequestSnapshot(BaseGithubTask, BaseDevhubTask):
         table.add_column("Field", style="cyan")
         table.add_column("Value", style="magenta")
 
-        for field in [
-            "Id",
-            "SnapshotName",
-            "Status",
-            "Description",
-            "CreatedDate",
-            "ExpirationDate",
-        ]:
+        for field in PR_SNAPSHOT_REPORT_FIELDS:
             value = snapshot.get(field, "N/A")
-            if field in ["CreatedDate", "ExpirationDate"]:
+            if field in PR_SNAPSHOT_DATETIME_FIELDS:
                 value = self._format_datetime(value)
             table.add_row(field, str(value))
 
@@ -911,24 +1003,20 @@ class GithubPullRequestSnapshot(BaseGithubTask, BaseDevhubTask):
         # Output to GitHub Actions Job Summary
         summary_file = os.getenv("GITHUB_STEP_SUMMARY")
         if summary_file:
+            summary = (
+                "## Snapshot Creation Summary\n"
+                f"- **Snapshot ID**: {snapshot.get('Id')}\n"
+                f"- **Snapshot Name**: {snapshot.get('SnapshotName')}\n"
+                f"- **Status**: {snapshot.get('Status')}\n"
+                f"- **Description**: {snapshot.get('Description')}\n"
+                f"- **Created Date**: {self._format_datetime(snapshot.get('CreatedDate'))}\n"
+                f"- **Expiration Date**: {self._format_datetime(snapshot.get('ExpirationDate'))}\n"
+            )
             with open(summary_file, "a") as f:
-                f.write(f"## Snapshot Creation Summary\n")
-                f.write(f"- **Snapshot ID**: {snapshot.get('Id')}\n")
-                f.write(f"- **Snapshot Name**: {snapshot.get('SnapshotName')}\n")
-                f.write(f"- **Status**: {snapshot.get('Status')}\n")
-                f.write(f"- **Description**: {snapshot.get('Description')}\n")
-                f.write(
-                    f"- **Created Date**: {self._format_datetime(snapshot.get('CreatedDate'))}\n"
-                )
-                f.write(
-                    f"- **Expiration Date**: {self._format_datetime(snapshot.get('ExpirationDate'))}\n"
-                )
+                f.write(summary)
 
     def _format_datetime(self, date_string):
-        if date_string is None:
-            return "N/A"
-        dt = parse(date_string)
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
+        return _format_datetime_string(date_string)
 
     def _create_commit_status(self, snapshot_name, state):
         try:
@@ -956,19 +1044,14 @@ class GithubPullRequestSnapshot(BaseGithubTask, BaseDevhubTask):
                 f"{self.options['github_environment_prefix']}{snapshot_name}"
             )
 
-            # Check if environment already exists
-            resp = self.repo._get(f"{self.repo.url}/environments/{environment_name}")
-            if resp.status_code == 404:
-                self.logger.info(f"Creating new environment: {environment_name}")
-                resp = self.repo._put(
-                    f"{self.repo.url}/environments/{environment_name}",
-                )
-                resp.raise_for_status()
-                self.logger.info(f"Created new environment: {environment_name}")
-            else:
-                self.logger.info(f"Environment '{environment_name}' already exists.")
-
-            environment = resp.json()
+            # PUT creates the environment or leaves an existing one as is,
+            # so there's no need to check for it first.
+            self.logger.info(f"Creating or updating environment: {environment_name}")
+            resp = self.repo._put(
+                f"{self.repo.url}/environments/{environment_name}",
+            )
+            resp.raise_for_status()
+            self.logger.info(f"Environment '{environment_name}' is ready.")
 
             self.console.print(
                 Panel(
@@ -0,0 +1,341 @@
+import logging
+import os
+from unittest import mock
+
+import pytest
+from pydantic import ValidationError
+
+from cumulusci.tasks.salesforce.tests.util import create_task
+from cumulusci.tasks.snapshot import (
+    DATE_FORMAT,
+    GithubPullRequestSnapshot,
+    SnapshotManager,
+    SnapshotNameValidator,
+    _format_datetime_string,
+)
+
+
+class TestSnapshotManager:
+    def _manager(self, total_size=1):
+        devhub = mock.Mock()
+        devhub.query.return_value = {
+            "totalSize": total_size,
+            "records": [{"Id": "0Oo000000000001"}] if total_size else [],
+        }
+        return SnapshotManager(devhub, logging.getLogger(__name__))
+
+    def test_query_existing_active_snapshot__cached(self):
+        manager = self._manager()
+
+        manager.query_existing_active_snapshot("CCIPr1M")
+        manager.query_existing_active_snapshot("CCIPr1M")
+
+        assert manager.existing_active_snapshot_id == "0Oo000000000001"
+        manager.devhub.query.assert_called_once()
+
+    def test_query_existing_active_snapshot__cached_miss(self):
+        manager = self._manager(total_size=0)
+
+        manager.query_existing_active_snapshot("CCIPr1M")
+        manager.query_existing_active_snapshot("CCIPr1M")
+
+        assert manager.existing_active_snapshot_id is None
+        manager.devhub.query.assert_called_once()
+
+    def test_query_existing_active_snapshot__invalidated(self):
+        manager = self._manager()
+
+        manager.query_existing_active_snapshot("CCIPr1M")
+        manager.rename_snapshot("0Oo000000000002", "CCIPr1M")
+        manager.query_existing_active_snapshot("CCIPr1M")
+
+        assert manager.devhub.query.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "date_string",
+    [
+        "2024-05-01T12:34:56.000+0000",
+        "2024-05-01T12:34:56Z",
+        "2024-05-01T12:34:56.000+00:00",
+    ],
+)
+def test_format_datetime_string(date_string):
+    assert _format_datetime_string(date_string) == "2024-05-01 12:34:56"
+
+
+def test_format_datetime_string__date():
+    assert _format_datetime_string("2024-05-01") == "2024-05-01 00:00:00"
+
+
+class TestGithubPullRequestSnapshot:
+    def _task(self, **options):
+        options = {
+            "project_code": "CC",
+            "build_success": True,
+            "build_fail_tests": False,
+            "snapshot_is_packaged": False,
+            **options,
+        }
+        task = create_task(GithubPullRequestSnapshot, options)
+        task.console = mock.Mock()
+        task.repo = mock.Mock(url="https://api.github.com/repos/TestOwner/TestRepo")
+        return task
+
+    def test_init_options__bool_options(self):
+        task = self._task(build_success="False", snapshot_pr_draft="True")
+
+        assert task.options["build_success"] is False
+        assert task.options["snapshot_pr_draft"] is True
+        assert task.options["wait"] is True
+        assert task.options["snapshot_fail_pr"] is True
+        assert task.options["snapshot_fail_test_only"] is False
+
+    def test_run_task__skips_pr_lookup(self):
+        task = self._task(snapshot_pr=False)
+        task._get_pull_request = mock.Mock()
+
+        task._run_task()
+
+        task._get_pull_request.assert_not_called()
+        assert task.return_values["has_pr"] is False
+        assert task.return_values["pr_lookup_skipped"] is True
+        assert task.return_values["skip_reason"] == "snapshot_pr is False"
+
+    @pytest.mark.parametrize(
+        "options,expected",
+        [
+            ({}, True),
+            ({"snapshot_pr": False}, False),
+            ({"build_success": False, "snapshot_pr": False}, True),
+        ],
+    )
+    def test_needs_pr_lookup(self, options, expected):
+        assert self._task(**options)._needs_pr_lookup() is expected
+
+    def test_should_create_snapshot__labels(self):
+        task = self._task(snapshot_pr_label="snapshot")
+        pr = mock.Mock(draft=False, labels=[{"name": "bug"}, {"name": "snapshot"}])
+
+        assert task._should_create_snapshot(pr) is True
+        assert task.return_values["has_pr"] is True
+        assert task.return_values["pr_lookup_skipped"] is False
+        assert task.return_values["pr_has_snapshot_label"] is True
+        assert task.return_values["pr_has_snapshot_fail_label"] is False
+
+    def test_generate_snapshot_name_and_description__failed_build_without_pr(self):
+        task = self._task(build_success=False)
+        task.project_config.repo_info.update(branch="feature/test", commit="abc123")
+
+        assert task._should_create_snapshot(None) is True
+        assert task._generate_snapshot_name(None) == "CCFailNoPRM"
+        assert task._generate_snapshot_description(None) == (
+            "Snapshot for failed build of branch feature/test for commit abc123"
+        )
+
+    @pytest.mark.parametrize(
+        "options,pr,reason",
+        [
+            ({"snapshot_pr": False}, None, "snapshot_pr is False"),
+            ({}, None, "No pull request on the branch"),
+            (
+                {"snapshot_pr_label": "snapshot"},
+                mock.Mock(draft=False, labels=[]),
+                "Pull request does not have snapshot label",
+            ),
+            (
+                {},
+                mock.Mock(draft=True, labels=[]),
+                "Pull request is draft and snapshot_pr_draft is False",
+            ),
+        ],
+    )
+    def test_should_create_snapshot__skip_reason(self, options, pr, reason):
+        task = self._task(**options)
+
+        assert task._should_create_snapshot(pr) is False
+        assert task.return_values["skip_reason"] == reason
+
+    def test_should_create_snapshot__multiple_labels(self):
+        task = self._task(snapshot_pr_label="snapshot, snapshot-full")
+        pr = mock.Mock(draft=False, labels=[{"name": "snapshot-full"}])
+
+        assert task.options["snapshot_pr_label"] == "snapshot, snapshot-full"
+        assert task._pr_labels == {"snapshot", "snapshot-full"}
+        assert task._should_create_snapshot(pr) is True
+        assert task.return_values["pr_has_snapshot_label"] is True
+
+    def test_init_options__empty_label(self):
+        task = self._task(snapshot_pr_label="")
+
+        assert task.options["snapshot_pr_label"] == ""
+        assert task._pr_labels == frozenset()
+        assert task._should_create_snapshot(mock.Mock(draft=False, labels=[]))
+
+    def test_create_github_environment(self):
+        task = self._task(github_environment_prefix="Snap-")
+
+        task._create_github_environment("CCIPr1M")
+
+        task.repo._get.assert_not_called()
+        task.repo._put.assert_called_once_with(
+            "https://api.github.com/repos/TestOwner/TestRepo/environments/Snap-CCIPr1M"
+        )
+
+    def test_report_result__step_summary(self, tmp_path):
+        task = self._task()
+        summary_file = tmp_path / "summary.md"
+        snapshot = {
+            "Id": "0Oo000000000001",
+            "SnapshotName": "CCPr1M",
+            "Status": "Active",
+            "Description": "Snapshot for PR #1",
+            "CreatedDate": "2024-05-01T12:34:56.000+0000",
+            "ExpirationDate": "2024-05-31",
+        }
+
+        with mock.patch.dict(os.environ, {"GITHUB_STEP_SUMMARY": str(summary_file)}):
+            task._report_result(snapshot)
+
+        assert summary_file.read_text() == (
+            "## Snapshot Creation Summary\n"
+            "- **Snapshot ID**: 0Oo000000000001\n"
+            "- **Snapshot Name**: CCPr1M\n"
+            "- **Status**: Active\n"
+            "- **Description**: Snapshot for PR #1\n"
+            "- **Created Date**: 2024-05-01 12:34:56\n"
+            "- **Expiration Date**: 2024-05-31 00:00:00\n"
+        )
+
+    def test_run_task__commit_status_and_environment(self):
+        task = self._task(
+            commit_status_context="Snapshot", github_environment_prefix="Snap-"
+        )
+        task.devhub = mock.Mock()
+        task._get_pull_request = mock.Mock(
+            return_value=mock.Mock(number=1, title="Feature")
+        )
+        task._should_create_snapshot = mock.Mock(return_value=True)
+        task._report_result = mock.Mock()
+        task._create_commit_status = mock.Mock()
+        task._create_github_environment = mock.Mock()
+
+        with mock.patch("cumulusci.tasks.snapshot.SnapshotManager") as manager:
+            manager.return_value.update_snapshot_from_org.return_value = {
+                "Id": "0Oo000000000001",
+                "SnapshotName": "CCPr1M",
+                "Status": "Active",
+            }
+            task._run_task()
+
+        manager.assert_called_once_with(task.devhub, task.logger, console=task.console)
+        task._create_commit_status.assert_called_once_with(
+            snapshot_name="CCPr1M", state="success"
+        )
+        task._create_github_environment.assert_called_once_with("CCPr1M")
+
+    def test_run_task__no_wait_github_output(self, tmp_path):
+        task = self._task(wait=False)
+        task.devhub = mock.Mock()
+        task._get_pull_request = mock.Mock(
+            return_value=mock.Mock(number=1, title="Feature")
+        )
+        task._should_create_snapshot = mock.Mock(return_value=True)
+        task._report_result = mock.Mock()
+        output_file = tmp_path / "output"
+
+        with mock.patch(
+            "cumulusci.tasks.snapshot.SnapshotManager"
+        ) as manager, mock.patch.dict(os.environ, {"GITHUB_OUTPUT": str(output_file)}):
+            manager.return_value.update_snapshot_from_org.return_value = {
+                "Id": "0Oo000000000001",
+                "Status": "InProgress",
+            }
+            task._run_task()
+
+        assert output_file.read_text() == "SNAPSHOT_ID=0Oo000000000001"
+
+    def test_get_pull_request(self):
+        task = self._task(base_branch="main")
+        task.project_config.repo_info["branch"] = "feature/test"
+        other_pr = mock.Mock(number=1, state="open")
+        other_pr.head.ref = "feature/other"
+        other_pr.base.ref = "main"
+        pr = mock.Mock(number=2, state="open")
+        pr.head.ref = "feature/test"
+        pr.base.ref = "main"
+        task.repo.pull_requests.return_value = [other_pr, pr]
+
+        assert task._get_pull_request() is pr
+        task.repo.pull_requests.assert_called_once_with(state="open", base="main")
+
+
+class TestSnapshotManagerDescription:
+    def _manager(self, description):
+        devhub = mock.Mock()
+        devhub.query.return_value = {
+            "totalSize": 1,
+            "records": [{"Id": "0Oo000000000001", "Description": description}],
+        }
+        devhub.OrgSnapshot.get.return_value = {
+            "Id": "0Oo000000000001",
+            "Status": "Active",
+        }
+        return SnapshotManager(devhub, logging.getLogger(__name__))
+
+    def test_update_snapshot_from_org__matching_description(self):
+        manager = self._manager("Snapshot for commit abc")
+
+        snapshot = manager.update_snapshot_from_org(
+            "CCPr1M", "Snapshot for commit abc", "00D000000000001"
+        )
+
+        assert snapshot["Id"] == "0Oo000000000001"
+        manager.devhub.OrgSnapshot.create.assert_not_called()
+        manager.devhub.OrgSnapshot.delete.assert_not_called()
+
+    def test_update_snapshot_from_org__different_description(self):
+        manager = self._manager("Snapshot for commit abc")
+        manager.devhub.OrgSnapshot.create.return_value = {"id": "0Oo000000000002"}
+
+        manager.update_snapshot_from_org(
+            "CCPr1M", "Snapshot for commit def", "00D000000000001", wait=False
+        )
+
+        manager.devhub.OrgSnapshot.create.assert_called_once()
+        manager.devhub.OrgSnapshot.get.assert_called_once_with("0Oo000000000002")
+
+    def test_finalize_temp_snapshot__reused_snapshot(self):
+        manager = self._manager("Snapshot for commit abc")
+
+        manager.finalize_temp_snapshot(
+            "CCPr1M", "Snapshot for commit abc", "0Oo000000000001"
+        )
+
+        manager.devhub.OrgSnapshot.delete.assert_not_called()
+        manager.devhub.OrgSnapshot.update.assert_not_called()
+
+
+class TestSnapshotNameValidator:
+    def test_valid(self):
+        assert SnapshotNameValidator(base_name="CCPr123M").base_name == "CCPr123M"
+
+    @pytest.mark.parametrize(
+        "name,message",
+        [
+            ("CC-Pr1M", "alphanumeric"),
+            ("", "alphanumeric"),
+            ("CCPr1234567890M", "at most 13 characters"),
+        ],
+    )
+    def test_invalid(self, name, message):
+        with pytest.raises(ValidationError, match=message):
+            SnapshotNameValidator(base_name=name)
+
+
+def test_format_datetime_string__date_format():
+    assert _format_datetime_string("2024-05-01", DATE_FORMAT) == "2024-05-01"
+
+
+def test_format_datetime_string__none():
+    assert _format_datetime_string(None) == "N/A"